@@ -1,13 +1,39 @@
 """pyconfme, Configuration options with multiple config-files and command-line made easy when creating applications with Python Click. """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__= "0.0.0"
 
-from .config.click_config_option import click_config_option
-from .config.settings_doc import with_attrs_docs
-from .config.config_data_types import ConfigDataTypes
-from .config.config_file_loaders import get_settings_config_load_function
+# public names and the modules defining them; modules are imported on first attribute
+# access (PEP 562), so importing pyconfme does not pull in click and pydantic
+_LAZY_IMPORTS = {
+    "click_config_option": ".config.click_config_option",
+    "with_attrs_docs": ".config.settings_doc",
+    "ConfigDataTypes": ".config.config_data_types",
+    "get_settings_config_load_function": ".config.config_file_loaders",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .config.click_config_option import click_config_option
+    from .config.settings_doc import with_attrs_docs
+    from .config.config_data_types import ConfigDataTypes
+    from .config.config_file_loaders import get_settings_config_load_function
+
 
-# from .factory import GenericBuildArtifact, TGenericBuildArtifact, GenericBuilder, TGenericBuilder 
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+# from .factory import GenericBuildArtifact, TGenericBuildArtifact, GenericBuilder, TGenericBuilder
 # from .factory import IntDescriptor, StrDescriptor, AutoStrDescriptor, auto
 # from .factory import Factory
-
@@ -1,62 +1,173 @@
 """This module defines a decorator that provides an out-of-the box `--config`-option for click-commands."""
 
-from typing import Sequence, TypeVar, Dict, cast
+from typing import TypeVar, Dict, List, Any, Sequence, Tuple, Union
 from pathlib import Path
 from functools import partial
 
 import click
 from pydantic import BaseSettings, ValidationError
 
-from ..utility.dict_deep_update import dict_deep_update
-from .config_file_loaders import DictLoadError, load_dict_from_file
+from ..utility.dict_deep_update import _IMMUTABLE_VALUE_TYPES, dict_deep_update
+from .config_file_loaders import DictLoadError, _cached_load
 
 SettingsClassType = TypeVar("SettingsClassType", bound=BaseSettings)
 
+#: :obj:`int` :
+#: Number of characters of the parsed document shown before and after an error position
+DOCUMENT_CONTEXT_WINDOW: int = 80
 
-def _validate(
-    ctx: click.Context,
-    param,
-    value,
-    settings_obj: BaseSettings,
-    settings_class_type: SettingsClassType,
-):
-    if not value:
-        return []
-    if not isinstance(value, Sequence):
-        value = [value]
-    config_map = {}
+_DICT_LOAD_ERROR_TEMPLATE = (
+    "{message}\nContext:\n{document}\nPosition = {position},"
+    " line number = {line_number}, column_number = {column_number}"
+)
+
+# invariant keyword arguments of the config option, shared by all decorated commands;
+# click resolves the given paths, so messages name the config files unambiguously
+_PATH_TYPE = click.Path(exists=True, dir_okay=False, resolve_path=True)
+_BASE_OPTION_KWARGS = dict(
+    help="Config file path for loading settings from file.",
+    type=_PATH_TYPE,
+    expose_value=True,
+    is_eager=True,
+    multiple=True,
+)
+
+
+def _has_only_scalar_defaults(settings_obj: BaseSettings) -> bool:
+    """Check whether a settings object holds nothing but its (immutable) field defaults.
+    For such objects, pydantic re-creates all values during validation, so the merged
+    dictionary need not be seeded with them."""
+    return not settings_obj.__fields_set__ and all(
+        type(field.default) in _IMMUTABLE_VALUE_TYPES
+        for field in settings_obj.__fields__.values()
+    )
+
+
+def _settings_to_dict(settings_obj: BaseSettings) -> Dict[str, object]:
+    """Return the values of a settings object as dictionary. For flat settings
+    without aliases and with only immutable values, a shallow copy of the object's
+    `__dict__` is sufficient and avoids pydantic's recursive `dict()` serializer.
+    """
+    if all(
+        field.alias == name for name, field in settings_obj.__fields__.items()
+    ) and all(
+        type(value) in _IMMUTABLE_VALUE_TYPES for value in settings_obj.__dict__.values()
+    ):
+        return settings_obj.__dict__.copy()
+    return settings_obj.dict()
+
+
+def _format_dict_load_error(ex: DictLoadError) -> str:
+    """Format a DictLoadError for the terminal, showing only the part of the parsed
+    document around the error position instead of the whole document."""
+    document = ex.document
+    if document:
+        position = ex.position or 0
+        document = document[
+            max(0, position - DOCUMENT_CONTEXT_WINDOW) : position
+            + DOCUMENT_CONTEXT_WINDOW
+        ]
+    return _DICT_LOAD_ERROR_TEMPLATE.format(
+        message=ex.message,
+        document=document,
+        position=ex.position,
+        line_number=ex.line_number,
+        column_number=ex.column_number,
+    )
+
+
+class _ConfigCLIError(Exception):
+    """Error while loading, merging or validating config files given on the command
+    line; the message is shown to the user before aborting."""
+
+
+def _load_all(value: Sequence[Union[str, Path]]) -> List[Tuple[str, Any]]:
+    """Load all config files, returning (path, dictionary) pairs in command-line order.
+
+    Raises:
+        _ConfigCLIError: at the first file, which could not be parsed
+    """
+    load_results = []
     for config_file in value:
-        config_file = Path(config_file).resolve()
         try:
-            config_map[str(config_file)] = load_dict_from_file(config_file)
+            load_results.append((str(config_file), _cached_load(config_file)))
         except DictLoadError as ex:
-            click.echo(
-                f"{ex.message}\nContext:\n{ex.document}\nPosition = {ex.position},"
-                f" line number = {ex.line_number}, column_number = {ex.column_number}"
-            )
-            ctx.abort()
+            raise _ConfigCLIError(_format_dict_load_error(ex))
+    return load_results
+
 
-    target_config_dict = settings_obj.dict()
-    new_settings_obj: BaseSettings = None
-    for config_file, config_dict in config_map.items():
+def _merge_all(
+    settings_obj: BaseSettings, load_results: List[Tuple[str, Any]]
+) -> Dict[str, Any]:
+    """Merge the loaded dictionaries in order on top of the values of `settings_obj`.
+
+    Raises:
+        _ConfigCLIError: if a dictionary could not be merged
+    """
+    only_defaults = _has_only_scalar_defaults(settings_obj)
+    if len(load_results) == 1 and only_defaults:
+        # common case of a single config file and default settings: the loaded
+        # dictionary is already a private copy and needs no merging
+        return load_results[0][1]
+
+    target_config_dict = {} if only_defaults else _settings_to_dict(settings_obj)
+    for config_file, config_dict in load_results:
         try:
-            dict_deep_update(
-                target_config_dict, cast(Dict[object, object], config_dict)
-            )
+            dict_deep_update(target_config_dict, config_dict)  # type: ignore
         except RecursionError as ex:
-            click.echo(
+            raise _ConfigCLIError(
                 f"Error reading {config_file}.\nData structure depth exceeded.\n{ex}"
             )
-            ctx.abort()
         except ValueError as ex:
-            click.echo(f"{ex}")
-            ctx.abort()
+            raise _ConfigCLIError(f"{ex}")
+    return target_config_dict
 
-        try:
-            new_settings_obj = settings_class_type.parse_obj(target_config_dict)
-        except ValidationError as ex:
-            click.echo(f"Validation error for config file {config_file}.\n{ex}")
-            ctx.abort()
+
+def _validate_final(
+    target_config_dict: Dict[str, Any],
+    settings_class_type: SettingsClassType,
+    trust_input: bool,
+    config_files: Sequence[str],
+) -> BaseSettings:
+    """Create the settings object from the merged dictionary, validating only once.
+
+    Raises:
+        _ConfigCLIError: if the merged dictionary does not validate
+    """
+    if trust_input:
+        return settings_class_type.construct(**target_config_dict)
+    try:
+        return settings_class_type.parse_obj(target_config_dict)
+    except ValidationError as ex:
+        raise _ConfigCLIError(
+            f"Validation error for config file(s) {', '.join(config_files)}.\n{ex}"
+        )
+
+
+def _validate(
+    ctx: click.Context,
+    param,
+    value,
+    settings_obj: BaseSettings,
+    settings_class_type: SettingsClassType,
+    trust_input: bool = False,
+):
+    if not value:
+        return []
+    # click delivers a tuple for `multiple=True`, a single path only if overridden via `kw`
+    if isinstance(value, (str, Path)):
+        value = (value,)
+    try:
+        load_results = _load_all(value)
+        new_settings_obj = _validate_final(
+            _merge_all(settings_obj, load_results),
+            settings_class_type,
+            trust_input,
+            [config_file for config_file, _ in load_results],
+        )
+    except _ConfigCLIError as ex:
+        click.echo(f"{ex}")
+        ctx.abort()
 
     ctx.default_map = new_settings_obj.dict()
     return new_settings_obj
@@ -68,6 +179,7 @@ def click_config_option(
     click_obj=click,
     option_name: str = "config",
     option_short: str = "",
+    trust_input: bool = False,
     **kw,
 ):
     """Decorator that provides an out-of-the box `--config`-option for click-commands. The options allows
@@ -82,6 +194,9 @@ def click_config_option(
             | invoked on commandline with `--config=<path-to-config-file>`
         option_short_name: one-letter short-name, defaults to `c`. Eg. if `c` is given,
             | invoked on commandline with `-c <path-to-config-file>`
+        trust_input: if `True`, the merged configuration is not validated but loaded via
+            pydantic's `construct()`; only use for trusted config files and settings classes
+            without custom validators or nested models
     Returns:
         click-option object
     Example:
@@ -123,24 +238,21 @@ def click_config_option(
     ```
     """
 
-    option_kwargs = dict(
-        help="Config file path for loading settings from file.",
-        callback=partial(
+    # lstrip is only needed if there are leading dashes at all
+    if option_name[:1] == "-":
+        option_name = option_name.lstrip("-")
+    if option_short[:1] == "-":
+        option_short = option_short.lstrip("-")
+    option_short = option_short or option_name[0]
+
+    option_kwargs = {
+        **_BASE_OPTION_KWARGS,
+        "callback": partial(
             _validate,
             settings_obj=settings_obj,
             settings_class_type=settings_class_type,
+            trust_input=trust_input,
         ),
-        type=click.Path(exists=True, dir_okay=False, resolve_path=True),
-        expose_value=True,
-        is_eager=True,
-        multiple=True,
-    )
-    option_kwargs.update(kw)
-    option_short = (
-        option_short.lstrip("-")
-        if option_short.lstrip("-") != ""
-        else f"{option_name[0]}"
-    )
-    option_name = option_name.lstrip("-")
-    option = click_obj.option(f"--{option_name}", f"-{option_short}", **option_kwargs)
-    return option
+        **kw,
+    }
+    return click_obj.option(f"--{option_name}", f"-{option_short}", **option_kwargs)
@@ -1,11 +1,17 @@
 """Provides an enum-like class defining known config-file types"""
 
-from enum import Enum, auto
+from enum import IntEnum, auto
+from typing import List
 
-class ConfigDataTypes(Enum):
+class ConfigDataTypes(IntEnum):
     """Provides an enum-like class defining known config-file types"""
     toml = auto()
     json = auto()
     yaml = auto()
     infer = auto()
     unknown = auto()
+
+    @classmethod
+    def allowed_names(cls) -> List[str]:
+        """Returns the names of all known config-file types"""
+        return [member.name for member in cls]
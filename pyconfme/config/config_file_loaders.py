@@ -3,21 +3,90 @@
 
 import sys
 import os
+import stat
 import io
-from os import PathLike
+import re
+import codecs
+import copy
 import errno
-from pathlib import Path
-import yaml
-import toml
 import json
-from functools import partial
-from typing import Any, MutableMapping, Dict, Callable, cast, Union, Sequence, AnyStr
+from collections import OrderedDict
+from enum import IntEnum, auto
+from functools import partial, lru_cache
+from mmap import ACCESS_READ
+from os import PathLike
+from pathlib import Path, PurePath
+from threading import Lock
+from typing import (
+    Any,
+    MutableMapping,
+    Dict,
+    Callable,
+    cast,
+    Union,
+    Sequence,
+    AnyStr,
+    AbstractSet,
+    Optional,
+    Tuple,
+)
+
+import toml
 from pydantic import BaseSettings
+
 from .config_data_types import ConfigDataTypes
 from ..utility.typing import FilePathOrBuffer, Buffer, mmap
 from ..utility.dict_deep_update import dict_deep_update
 
+try:
+    # read-ahead hint for mapped files, only available on some platforms
+    from mmap import MADV_SEQUENTIAL as _MADV_SEQUENTIAL
+except ImportError:  # pragma: no cover
+    _MADV_SEQUENTIAL = None  # type: ignore
+
+# optional faster parsers, the standard library / declared dependencies are used otherwise
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+try:
+    import tomllib  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import tomli as tomllib  # type: ignore
+    except ImportError:
+        tomllib = None  # type: ignore
+try:
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore
+
 MAX_CONFIG_FILE_SIZE = 1024 * 1024 * 1024
+# maximum number of parsed config files kept in the parse cache
+PARSE_CACHE_SIZE = 128
+# parsed config files by (device, inode, data type, encoding, modification time, size)
+_PARSE_CACHE: "OrderedDict[Any, MutableMapping[str, Any]]" = OrderedDict()
+_PARSE_CACHE_LOCK = Lock()
+# data types, whose parsed files are cached; files of unknown type may turn out to be JSON
+_CACHED_DATA_TYPES = frozenset((ConfigDataTypes.toml, ConfigDataTypes.yaml))
+# UTF-8 files larger than this are memory-mapped instead of being read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+
+_TOML_DECODE_ERRORS = (
+    (toml.TomlDecodeError,)
+    if tomllib is None
+    else (toml.TomlDecodeError, tomllib.TOMLDecodeError)
+)
+_TOMLLIB_ERROR_POSITION = re.compile(r"\(at line (\d+), column (\d+)\)$")
+
+# number of bytes of a file's content attached to the DictLoadError raised, if no parser succeeds
+_ERROR_DOCUMENT_SIZE = 4096
+# number of bytes/characters looked at to guess the data type of a document's content
+_SNIFF_SIZE = 512
+_TOML_TABLE_LINE = re.compile(r"^\[\[?\s*[\w\"'.-]+\s*\]\]?\s*(#.*)?$")
+_TOML_KEY_VALUE_LINE = re.compile(r"^[\w\"'.-]+\s*=")
+_YAML_LINE = re.compile(r"^(---|%|[^\s#][^:]*:(\s|$))")
 
 
 class DictLoadError(Exception):
@@ -32,6 +101,7 @@ class DictLoadError(Exception):
         document: str = None,
         line_number: int = None,
         column_number: int = None,
+        document_provider: Optional[Callable[[], str]] = None,
     ):
         """Create new DictLoadException
         Args:
@@ -40,18 +110,61 @@ class DictLoadError(Exception):
             position: character position where the parsing error occurred, counting from document start
             line_number: line number in the read file where the parsing error occurred
             column_number: column number in the line where the parsing error occurred
+            document_provider: optional, function returning the document, called on first access of
+                `document` only, if no `document` is given
         """
 
         # Call the base class constructor with the parameters it needs
         super().__init__(message)
         self.message = message
-        self.document = document
+        self._document = document
+        self._document_provider = document_provider
         self.position = position
         self.line_number = line_number
         self.column_number = column_number
 
+    @property
+    def document(self) -> Union[str, None]:
+        """full or parts of the documents parsed into a dict, see `__init__`"""
+        if self._document is None and self._document_provider is not None:
+            self._document = self._document_provider()
+            self._document_provider = None
+        return self._document
+
+    @document.setter
+    def document(self, document: Union[str, None]) -> None:
+        self._document = document
+        self._document_provider = None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # the document provider may not be picklable, so the document is resolved
+        return (
+            type(self),
+            (
+                self.message,
+                self.position,
+                self.document,
+                self.line_number,
+                self.column_number,
+            ),
+        )
+
 
-def _determine_config_file_type(file_path: Union[Path, str]) -> ConfigDataTypes:
+# known (lower-case) file suffixes and the data type they determine
+_SUFFIX_DATA_TYPES: Dict[str, ConfigDataTypes] = {
+    ".json": ConfigDataTypes.json,
+    ".jsn": ConfigDataTypes.json,
+    ".toml": ConfigDataTypes.toml,
+    ".tml": ConfigDataTypes.toml,
+    ".ini": ConfigDataTypes.toml,
+    ".config": ConfigDataTypes.toml,
+    ".cfg": ConfigDataTypes.toml,
+    ".yml": ConfigDataTypes.yaml,
+    ".yaml": ConfigDataTypes.yaml,
+}
+
+
+def _determine_config_file_type(file_path: Union[PurePath, str]) -> ConfigDataTypes:
     """Determine the file type of a given file from its suffix and return determined type as enum-value
     Currently the following data-types are known:
 
@@ -70,27 +183,178 @@ def _determine_config_file_type(file_path: Union[Path, str]) -> ConfigDataTypes:
     ```python
     >>> from pyconfme.config.config_file_loaders import _determine_config_file_type
     >>> _determine_config_file_type("my_config.ini")
-    <ConfigDataTypes.toml: 'toml'>
+    <ConfigDataTypes.toml: 1>
 
     ```
     """
-    if isinstance(file_path, str):
-        file_path = Path(file_path)
-    if file_path.suffix.lower() in [".json", ".jsn"]:
-        return ConfigDataTypes.json
-    elif file_path.suffix.lower() in [
-        ".toml",
-        ".tml",
-        ".ini",
-        ".config",
-        ".cfg",
-    ]:
-        return ConfigDataTypes.toml
-    elif file_path.suffix.lower() in [".yml", ".yaml"]:
-        return ConfigDataTypes.yaml
-    else:
+    # a pure path suffices to parse the suffix, no file system access is needed
+    if not isinstance(file_path, PurePath):
+        file_path = PurePath(file_path)
+    return _SUFFIX_DATA_TYPES.get(file_path.suffix.lower(), ConfigDataTypes.unknown)
+
+
+@lru_cache(maxsize=None)
+def _yaml_loaders() -> Tuple[Any, Any, Any]:
+    """Import PyYAML on first use, so that loading JSON or TOML does not pay for it.
+
+    Returns:
+        the yaml module, the safe loader (libyaml-based, if PyYAML has been built with
+        libyaml) and a safe loader, which composes nodes from the parser's events, so
+        that parsing can stop in the middle of a document
+    """
+    import yaml
+
+    if not hasattr(yaml, "CSafeLoader"):  # pragma: no cover
+        return yaml, yaml.SafeLoader, yaml.SafeLoader
+
+    class _YamlEventLoader(
+        yaml.cyaml.CParser,
+        yaml.composer.Composer,
+        yaml.constructor.SafeConstructor,
+        yaml.resolver.Resolver,
+    ):
+        def __init__(self, stream):
+            yaml.cyaml.CParser.__init__(self, stream)
+            yaml.composer.Composer.__init__(self)
+            yaml.constructor.SafeConstructor.__init__(self)
+            yaml.resolver.Resolver.__init__(self)
+
+    return yaml, yaml.CSafeLoader, _YamlEventLoader
+
+
+def _is_utf8(encoding: Union[str, None]) -> bool:
+    """Check whether `encoding` names UTF-8, in which case parsers can consume raw bytes."""
+    return encoding is not None and codecs.lookup(encoding).name == "utf-8"
+
+
+def _decode(raw: bytes, encoding: Union[str, None], errors: str = "strict") -> str:
+    """Decode file content the same way `Path.read_text` does, eg. using the locale's
+    encoding if `encoding` is None."""
+    return io.TextIOWrapper(io.BytesIO(raw), encoding=encoding, errors=errors).read()
+
+
+def _check_data_source(file_path: Any) -> None:
+    """Raise a DictLoadError, if `file_path` is neither a path nor an opened file/stream/buffer.
+    Streams are duck-typed, as the parsers only read them and reset their position."""
+    if not isinstance(file_path, Path) and not (
+        hasattr(file_path, "read") and hasattr(file_path, "seek")
+    ):
+        raise DictLoadError(
+            message=f"Invalid file provided {str(file_path)}.",
+            document="",
+            position=0,
+            line_number=0,
+            column_number=0,
+        )
+
+
+def _json_loads(document: Union[str, bytes, memoryview]) -> Any:
+    """Parse a JSON document with orjson, if installed, else with the standard library."""
+    if orjson is not None:
+        try:
+            return orjson.loads(document)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (eg. NaN, big integers),
+            # let the standard library decide and report the error position
+            pass
+    if isinstance(document, memoryview):
+        document = document.tobytes()
+    return json.loads(document)
+
+
+def _toml_loads(document: str) -> MutableMapping[str, Any]:
+    """Parse a TOML document with tomllib/tomli, if available, else with toml."""
+    if tomllib is not None:
+        return tomllib.loads(document)
+    return toml.loads(document)
+
+
+def _toml_decode_error_to_dict_load_error(
+    e: Exception, document: Union[str, None]
+) -> DictLoadError:
+    """Convert a decode error of one of the TOML parsers into a DictLoadError. tomllib
+    reports the error position only as part of its message."""
+    if isinstance(e, toml.TomlDecodeError):
+        return DictLoadError(
+            message=e.msg,  # type: ignore
+            document=e.doc,  # type: ignore
+            position=e.pos,  # type: ignore
+            line_number=e.lineno,  # type: ignore
+            column_number=e.colno,  # type: ignore
+        )
+    message = str(e)
+    line_number = column_number = position = None
+    match = _TOMLLIB_ERROR_POSITION.search(message)
+    if match is not None:
+        line_number, column_number = int(match.group(1)), int(match.group(2))
+        message = message[: match.start()].rstrip()
+        if document is not None:
+            position = (
+                sum(len(line) for line in document.splitlines(True)[: line_number - 1])
+                + column_number
+                - 1
+            )
+    return DictLoadError(
+        message=message,
+        document=document,
+        position=position,
+        line_number=line_number,
+        column_number=column_number,
+    )
+
+
+def _sniff_config_data_type(
+    file_path: Union[Path, Buffer[AnyStr]]
+) -> ConfigDataTypes:
+    """Guess the data type from the first meaningful line of a document's content,
+    reading at most `_SNIFF_SIZE` bytes/characters. The position of opened
+    files/streams/buffers is restored afterwards.
+
+    Args:
+        file_path: path to the file or opened stream or buffer
+    Returns:
+        the guessed data type or `ConfigDataTypes.unknown`, if no guess is possible
+    Example:
+    ```python
+    >>> from io import StringIO
+    >>> from pyconfme.config.config_file_loaders import _sniff_config_data_type
+    >>> _sniff_config_data_type(StringIO("# comment\\n[runserver]\\nport = 1"))
+    <ConfigDataTypes.toml: 1>
+
+    ```
+    """
+    try:
+        if isinstance(file_path, Path):
+            with file_path.open("rb") as stream:
+                head = stream.read(_SNIFF_SIZE)
+        else:
+            position = file_path.tell()  # type: ignore
+            head = file_path.read(_SNIFF_SIZE)  # type: ignore
+            file_path.seek(position)  # type: ignore
+    except (AttributeError, OSError, ValueError):
+        return ConfigDataTypes.unknown
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="ignore")
+    if not isinstance(head, str):
         return ConfigDataTypes.unknown
 
+    for line in head.lstrip("\ufeff").splitlines():
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            return ConfigDataTypes.json
+        if _TOML_TABLE_LINE.match(line):
+            return ConfigDataTypes.toml
+        if line.startswith("["):
+            return ConfigDataTypes.json
+        if _TOML_KEY_VALUE_LINE.match(line):
+            return ConfigDataTypes.toml
+        if _YAML_LINE.match(line):
+            return ConfigDataTypes.yaml
+        break
+    return ConfigDataTypes.unknown
+
 
 def _load_dict_from_json_stream_or_file(
     file_path: Union[PathLike[str], Buffer[AnyStr]],
@@ -98,7 +362,8 @@ def _load_dict_from_json_stream_or_file(
     encoding: str = "utf-8",
 ) -> Union[MutableMapping[str, Any], None]:
     """Load the content of a structured text file or stream into a dictionary using one
-    of the JSON parsing library (from standard lib https://docs.python.org/3/library/json.html)
+    of the JSON parsing library ([orjson](https://github.com/ijl/orjson), if installed, otherwise
+    from standard lib https://docs.python.org/3/library/json.html)
     Internal function which assumes checking of file existance, accessibility and size has been done elsewhere.
     Args:
         file_path: path to the file to be parsed or opened stream or buffer
@@ -110,19 +375,21 @@ def _load_dict_from_json_stream_or_file(
         dictionary with parsed file/buffer/stream content or None in case of error and no exception was raised. In case of error, resets file-pointer to 0, if open file was given.
     """
 
+    _check_data_source(file_path)
     try:
         if isinstance(file_path, Path):
-            return json.loads(file_path.read_text(encoding=encoding))
+            return _json_loads(
+                file_path.read_bytes()
+                if _is_utf8(encoding)
+                else file_path.read_text(encoding=encoding)
+            )
+        elif isinstance(file_path, mmap) and file_path.tell() == 0:
+            # parse the mapped file without copying it into memory first; the
+            # view has to be released before the mapping can be closed
+            with memoryview(file_path) as view:
+                return _json_loads(view)
         else:
-            return json.load(file_path)  # type: ignore
-    except AttributeError as e:
-        raise DictLoadError(
-            message=f"Invalid file provided {str(file_path)}.",
-            document="",
-            position=0,
-            line_number=0,
-            column_number=0,
-        )
+            return _json_loads(file_path.read())  # type: ignore
     except json.JSONDecodeError as e:
         if data_type == ConfigDataTypes.json:
             raise DictLoadError(
@@ -145,7 +412,8 @@ def _load_dict_from_toml_stream_or_file(
     encoding: str = "utf-8",
 ) -> Union[MutableMapping[str, Any], None]:
     """Load the content of a structured text file or stream into a dictionary using one
-    of the TOML parsing library (from https://github.com/uiri/toml)
+    of the TOML parsing libraries (standard lib `tomllib` or its backport
+    [tomli](https://github.com/hukkin/tomli), if available, otherwise https://github.com/uiri/toml)
     Internal function which assumes checking of file existance, accessibility and size has been done elsewhere.
     Args:
         file_path: path to the file to be parsed or opened stream or buffer
@@ -157,32 +425,24 @@ def _load_dict_from_toml_stream_or_file(
         dictionary with parsed file/buffer/stream content or None in case of error and no exception was raised. In case of error, resets file-pointer to 0, if open file was given.
     """
 
+    _check_data_source(file_path)
+    document = None
     try:
-        if (hasattr(file_path, "mode") and "b" in file_path.mode) or isinstance(   # type: ignore
+        if isinstance(file_path, Path):
+            # TOML documents are UTF-8 by specification
+            document = file_path.read_text(encoding="utf-8")
+        elif (hasattr(file_path, "mode") and "b" in file_path.mode) or isinstance(   # type: ignore
             file_path, (io.RawIOBase, io.BufferedIOBase, mmap)
-        ):  
-            return toml.loads(file_path.read().decode(encoding))  # type: ignore
+        ):
+            document = file_path.read().decode(encoding)  # type: ignore
         elif isinstance(file_path, io.StringIO):
-            return toml.loads(file_path.getvalue())  # type: ignore
+            document = file_path.getvalue()
         else:
-            return toml.load(file_path)  # type: ignore
-    except TypeError as e:
-        raise DictLoadError(
-            message=f"Invalid file provided {str(file_path)}.",
-            document="",
-            position=0,
-            line_number=0,
-            column_number=0,
-        )
-    except toml.TomlDecodeError as e:
+            document = file_path.read()  # type: ignore
+        return _toml_loads(document)  # type: ignore
+    except _TOML_DECODE_ERRORS as e:
         if data_type == ConfigDataTypes.toml:
-            raise DictLoadError(
-                message=e.msg,  # type: ignore
-                document=e.doc,  # type: ignore
-                position=e.pos,  # type: ignore
-                line_number=e.lineno,  # type: ignore
-                column_number=e.colno,  # type: ignore
-            )
+            raise _toml_decode_error_to_dict_load_error(e, document)
     # on error, reset file pointer, if opened file-like was given
     if not isinstance(file_path, Path):
         file_path.seek(0)  # type: ignore
@@ -196,7 +456,7 @@ def _load_dict_from_yaml_stream_or_file(
     encoding: str = "utf-8",
 ) -> Union[MutableMapping[str, Any], None]:
     """Load the content of a structured text file or stream into a dictionary using one
-    of the YAML parsing library (from https://pyyaml.org/)
+    of the YAML parsing library (from https://pyyaml.org/, using the libyaml-based loader if available)
     Internal function which assumes checking of file existance, accessibility and size has been done elsewhere.
     Args:
         file_path: path to the file to be parsed or opened stream or buffer
@@ -208,19 +468,18 @@ def _load_dict_from_yaml_stream_or_file(
         dictionary with parsed file/buffer/stream content or None in case of error and no exception was raised. In case of error, resets file-pointer to 0, if open file was given.
     """
 
+    _check_data_source(file_path)
+    yaml, yaml_loader, _ = _yaml_loaders()
     try:
         if isinstance(file_path, Path):
-            return yaml.safe_load(file_path.read_text(encoding=encoding))
+            if _is_utf8(encoding):
+                # let the parser read the binary file in chunks instead of
+                # allocating the whole document up-front
+                with file_path.open("rb") as stream:
+                    return yaml.load(stream, Loader=yaml_loader)
+            return yaml.load(file_path.read_text(encoding=encoding), Loader=yaml_loader)
         else:
-            return yaml.safe_load(file_path)  # type: ignore
-    except AttributeError as e:
-        raise DictLoadError(
-            message=f"Invalid file provided {str(file_path)}.",
-            document="",
-            position=0,
-            line_number=0,
-            column_number=0,
-        )
+            return yaml.load(file_path, Loader=yaml_loader)  # type: ignore
     except yaml.YAMLError as e:
         if data_type == ConfigDataTypes.yaml:
             if hasattr(e, 'problem_mark'):
@@ -242,6 +501,130 @@ def _load_dict_from_yaml_stream_or_file(
     return None
 
 
+def _load_filtered_dict_from_json_stream(
+    stream: Union[io.BytesIO, mmap], key_filter: Optional[AbstractSet[str]]
+) -> Union[MutableMapping[str, Any], None]:
+    """Incrementally parse a binary JSON stream with ijson and build only the values of
+    the top-level keys in `key_filter`; the parse events of all other values are skipped.
+
+    Args:
+        stream: binary stream with the JSON document
+        key_filter: top-level keys to be returned, all keys, if None
+    Returns:
+        dictionary with the filtered top-level keys or None, if the document is no
+        JSON object or could not be parsed by ijson. In this case, the stream is reset
+        to position 0.
+    """
+    result: Dict[str, Any] = {}
+    depth = 0
+    key = None
+    builder = None
+    try:
+        for event, value in ijson.basic_parse(stream, use_float=True):
+            if depth == 0 and event != "start_map":
+                break
+            if event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 1 and event == "map_key":
+                key = value
+                builder = (
+                    ijson.ObjectBuilder()
+                    if key_filter is None or value in key_filter
+                    else None
+                )
+            elif builder is not None and depth >= 1:
+                builder.event(event, value)
+                # a scalar or a closed container on the top-level completes the value
+                if depth == 1 and event not in ("start_map", "start_array"):
+                    result[key] = builder.value  # type: ignore
+                    builder = None
+            if event in ("start_map", "start_array"):
+                depth += 1
+        else:
+            if depth == 0:
+                return result
+    except ijson.JSONError:
+        pass
+    stream.seek(0)
+    return None
+
+
+def _load_filtered_dict_from_yaml_stream(
+    stream: Buffer[AnyStr], key_filter: AbstractSet[str]
+) -> Union[MutableMapping[str, Any], None]:
+    """Parse a YAML stream, constructing only the values of the top-level keys in
+    `key_filter`; values of other keys are composed (to keep anchors and to check the
+    syntax of the whole document), but not constructed.
+
+    Args:
+        stream: stream with the YAML document
+        key_filter: top-level keys to be returned
+    Returns:
+        dictionary with the filtered top-level keys or None, if the stream holds no
+        single mapping document, uses merge keys or could not be parsed. In this case,
+        the stream is reset to position 0.
+    """
+    yaml, _, event_loader = _yaml_loaders()
+    loader = event_loader(stream)
+    try:
+        loader.get_event()
+        if loader.check_event(yaml.DocumentStartEvent):
+            loader.get_event()
+            if loader.check_event(yaml.MappingStartEvent):
+                loader.get_event()
+                result: Dict[str, Any] = {}
+                while not loader.check_event(yaml.MappingEndEvent):
+                    key = loader.construct_object(
+                        loader.compose_node(None, None), deep=True
+                    )
+                    if key == "<<":
+                        break
+                    value_node = loader.compose_node(None, None)
+                    if key in key_filter:
+                        # later duplicates overwrite earlier ones, as in a full parse
+                        result[key] = loader.construct_object(value_node, deep=True)
+                else:
+                    loader.get_event()
+                    # further documents make the full parse fail, leave this to it
+                    if loader.check_event(yaml.DocumentEndEvent):
+                        loader.get_event()
+                        if loader.check_event(yaml.StreamEndEvent):
+                            return result
+    except (yaml.YAMLError, TypeError):
+        pass
+    finally:
+        loader.dispose()
+    stream.seek(0)  # type: ignore
+    return None
+
+
+# data type names listed in the error message, if no parser succeeds
+_ALLOWED_NAMES_JOINED = ", ".join(ConfigDataTypes.allowed_names())
+
+# loaders in the order they are tried, depending on the given/determined data type
+_DEFAULT_RESOLVE_ORDER = (
+    _load_dict_from_json_stream_or_file,
+    _load_dict_from_toml_stream_or_file,
+    _load_dict_from_yaml_stream_or_file,
+)
+_RESOLVE_ORDERS: Dict[
+    ConfigDataTypes,
+    Sequence[Callable[..., Union[MutableMapping[str, Any], None]]],
+] = {
+    ConfigDataTypes.json: _DEFAULT_RESOLVE_ORDER,
+    ConfigDataTypes.toml: (
+        _load_dict_from_toml_stream_or_file,
+        _load_dict_from_json_stream_or_file,
+        _load_dict_from_yaml_stream_or_file,
+    ),
+    ConfigDataTypes.yaml: (
+        _load_dict_from_yaml_stream_or_file,
+        _load_dict_from_json_stream_or_file,
+        _load_dict_from_toml_stream_or_file,
+    ),
+}
+
+
 def load_dict_from_file(
     file_path: FilePathOrBuffer,
     data_type: ConfigDataTypes = ConfigDataTypes.infer,
@@ -312,92 +695,386 @@ def load_dict_from_file(
     """
     if file_path is None:
         raise ValueError("Data input object is None.")
+    # paths are not resolved: opening and stat-ing them follows symlinks anyway, and
+    # error messages keep the path given by the caller
     if isinstance(file_path, str):
         file_path = Path(file_path)
 
-    determined_data_type = data_type
-
     # if the given input is a path to a file try to make sure it exists
     # and is readable. Also try to determine the data type by looking at
     # the file suffix, in case the function's caller has not defined the data type
     if isinstance(file_path, Path):
-        file_path = file_path.resolve()
+        return _load_dict_from_path(
+            file_path, _stat_config_file(file_path), data_type, encoding, max_file_size
+        )
+    return _load_dict_from_data_source(file_path, file_path, None, data_type, encoding)
 
-        if not file_path.is_file():
-            if not file_path.exists():
-                raise FileNotFoundError(
-                    errno.ENOENT, os.strerror(errno.ENOENT), str(file_path)
-                )
-            if file_path.is_dir():
-                raise IsADirectoryError(
-                    errno.ENOENT, "Is a directory instead of a file", str(file_path)
-                )
 
-        file_size = file_path.stat().st_size
-        if file_size > max_file_size:
-            raise ValueError(
-                f"File {str(file_path)}: File size {file_size} exceeds max allowed size"
-                f" {max_file_size}."
-            )
+def _stat_config_file(file_path: Union[str, Path]) -> os.stat_result:
+    """Stat a config file; a single stat call tells existence, type and size of the file.
+
+    Args:
+        file_path: path to the file
+    Raises:
+        FileNotFoundError: if `file_path` could not be resolved and/or file was not accessible
+        IsADirectoryError: if `file_path` could be resolved, but is a directory instead of a file
+    Returns:
+        the file's stat result
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(file_path))
+    if stat.S_ISDIR(file_stat.st_mode):
+        raise IsADirectoryError(
+            errno.ENOENT, "Is a directory instead of a file", str(file_path)
+        )
+    return file_stat
+
+
+def _map_config_file(file_path: Path) -> Optional[mmap]:
+    """Map a config file read-only into memory. The parsers read the mapping front to
+    back, so the operating system is advised to read ahead, where supported.
+
+    Args:
+        file_path: path to the file to be mapped
+    Returns:
+        the mapping or `None`, if the file cannot be mapped (eg. on some special or
+        network file systems), in which case the caller should read the file instead
+    """
+    try:
+        with file_path.open("rb") as stream:
+            mapped_content = mmap(stream.fileno(), 0, access=ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if _MADV_SEQUENTIAL is not None:
+        try:
+            mapped_content.madvise(_MADV_SEQUENTIAL)
+        except OSError:
+            # the hint is optional, the mapping is still usable without it
+            pass
+    return mapped_content
+
+
+def _load_dict_from_path(
+    file_path: Path,
+    file_stat: os.stat_result,
+    data_type: ConfigDataTypes,
+    encoding: str,
+    max_file_size: int = MAX_CONFIG_FILE_SIZE,
+    key_filter: Optional[AbstractSet[str]] = None,
+) -> MutableMapping[str, Any]:
+    """Load a config file, which has already been checked by
+    [_stat_config_file][pyconfme.config.config_file_loaders._stat_config_file], see
+    [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file].
+
+    Args:
+        file_path: path to the file to be parsed
+        file_stat: the file's stat result
+        data_type: see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+        encoding: see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+        max_file_size: see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+        key_filter: optional, top-level keys to be returned, see
+            [_load_filtered_dict_from_file][pyconfme.config.config_file_loaders._load_filtered_dict_from_file]
+    Raises:
+        DictLoadError: if the file could not be read into a dictionary (eg due to wrong syntax)
+        ValueError: if the file's size > max_file_size
+    Returns:
+        dictionary with parsed file content
+    """
+    file_size = file_stat.st_size
+    if file_size > max_file_size:
+        raise ValueError(
+            f"File {str(file_path)}: File size {file_size} exceeds max allowed size"
+            f" {max_file_size}."
+        )
+
+    determined_data_type = (
+        _determine_config_file_type(file_path)
+        if data_type == ConfigDataTypes.infer
+        else data_type
+    )
+
+    # read the file only once and let all parsers work on the in-memory content;
+    # large files are mapped, so the operating system pages them in on demand
+    mapped_content = (
+        _map_config_file(file_path)
+        if _is_utf8(encoding) and file_size > MMAP_THRESHOLD
+        else None
+    )
+    if mapped_content is not None:
+        data_source: Union[Buffer[AnyStr], io.BytesIO, io.StringIO] = mapped_content
+        raw_content: Union[bytes, mmap] = mapped_content
+    else:
+        raw_content = file_path.read_bytes()
+        data_source = (
+            io.BytesIO(raw_content)
+            if _is_utf8(encoding)
+            else io.StringIO(_decode(raw_content, encoding))
+        )
+
+    try:
+        return _load_dict_from_data_source(
+            file_path,
+            data_source,
+            raw_content,
+            determined_data_type,
+            encoding,
+            key_filter,
+        )
+    finally:
+        if mapped_content is not None:
+            mapped_content.close()
+
+
+def _load_filtered_dict_from_file(
+    file_path: Union[str, Path],
+    key_filter: AbstractSet[str],
+    data_type: ConfigDataTypes = ConfigDataTypes.infer,
+    encoding: str = "utf-8",
+) -> MutableMapping[str, Any]:
+    """Load only the top-level keys in `key_filter` from a config file, see
+    [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file].
+    JSON files are parsed incrementally with [ijson](https://pypi.org/project/ijson/),
+    if installed, and of YAML documents only the values of the filtered keys are
+    constructed, so that values of discarded keys are never built.
+
+    Args:
+        file_path: path to the file to be parsed
+        key_filter: top-level keys to be returned, all other keys are discarded
+        data_type: see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+        encoding: see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+    Raises:
+        DictLoadError: if the file could not be read into a dictionary (eg due to wrong syntax)
+        FileNotFoundError: if `file_path` could not be resolved and/or file was not accessible
+        IsADirectoryError: if `file_path` could be resolved, but is a directory instead of a file
+    Returns:
+        dictionary with the filtered top-level keys of the parsed file content
+    """
+    file_path = Path(file_path)
+    return _load_dict_from_path(
+        file_path,
+        _stat_config_file(file_path),
+        data_type,
+        encoding,
+        key_filter=key_filter,
+    )
+
+
+def load_dict_from_string(
+    document: Union[str, bytes],
+    data_type: ConfigDataTypes = ConfigDataTypes.infer,
+    encoding: str = "utf-8",
+) -> MutableMapping[str, Any]:
+    """Load an in-memory JSON, TOML or YAML document into a dictionary. Unlike
+    [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file],
+    a string is taken as the document's content instead of a path to a file.
+
+    Args:
+        document: content to be parsed
+        data_type: optional, pre-defines the data type to be parsed; if `ConfigDataTypes.unknown` or `ConfigDataTypes.infer`, data type is determined by the content
+        encoding: encoding type used to decode `document`, if bytes are given
+    Raises:
+        DictLoadError: if `document` could not be read into a dictionary (eg due to wrong syntax)
+    Returns:
+        dictionary with parsed content
+    Example:
+    ```python
+    >>> from pyconfme.config.config_file_loaders import load_dict_from_string
+    >>> load_dict_from_string('foobar = "johndoe"')
+    {'foobar': 'johndoe'}
 
-        determined_data_type = (
-            _determine_config_file_type(file_path)
-            if data_type == ConfigDataTypes.infer
-            else data_type
+    ```
+    """
+    if isinstance(document, str):
+        return _load_dict_from_data_source(
+            "<string>", io.StringIO(document), None, data_type, encoding
         )
+    # as for files, only UTF-8 is parsed from the raw bytes, other encodings are decoded
+    data_source: Union[io.BytesIO, io.StringIO] = (
+        io.BytesIO(document)
+        if _is_utf8(encoding)
+        else io.StringIO(_decode(document, encoding))
+    )
+    return _load_dict_from_data_source(
+        "<bytes>", data_source, document, data_type, encoding
+    )
+
+
+def _load_dict_from_data_source(
+    file_path: FilePathOrBuffer,
+    data_source: Union[Path, Buffer[AnyStr]],
+    raw_content: Union[bytes, mmap, None],
+    determined_data_type: ConfigDataTypes,
+    encoding: str,
+    key_filter: Optional[AbstractSet[str]] = None,
+) -> MutableMapping[str, Any]:
+    """Try the parsers on `data_source` one after the other, see
+    [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file].
+
+    Args:
+        file_path: path to the file or opened stream or buffer as given by the caller
+        data_source: opened stream or buffer to be parsed
+        raw_content: the file's content, if `file_path` is a path, otherwise None
+        determined_data_type: data type given by the caller or by the file suffix
+        encoding: encoding type used to decode binary streams/buffers
+        key_filter: optional, top-level keys to be returned
+    Raises:
+        DictLoadError: if none of the parsers could read `data_source` into a dictionary
+    Returns:
+        dictionary with parsed file/buffer/stream content
+    """
 
     # set the order in which file is tried to be loaded in a way that a given (by argument
     # or by file-ending) data-type is done first, then json as this is the most significant
-    # regarding the data and finally the remaining types.
-    resolve_order = [ConfigDataTypes.json, ConfigDataTypes.toml, ConfigDataTypes.yaml]
-    if determined_data_type == ConfigDataTypes.toml:
-        resolve_order = [
-            ConfigDataTypes.toml,
-            ConfigDataTypes.json,
-            ConfigDataTypes.yaml,
-        ]
-    elif determined_data_type == ConfigDataTypes.yaml:
-        resolve_order = [
-            ConfigDataTypes.yaml,
-            ConfigDataTypes.json,
-            ConfigDataTypes.toml,
-        ]
-
-    for resolve_data_type in resolve_order:
-        if resolve_data_type == ConfigDataTypes.json:
-            result = _load_dict_from_json_stream_or_file(
-                file_path, determined_data_type, encoding=encoding
-            )
-            if result is not None:
-                return result
+    # regarding the data and finally the remaining types. If neither argument nor
+    # file-ending define the data-type, a guess from the content decides what is tried first.
+    order_data_type = determined_data_type
+    if determined_data_type in (ConfigDataTypes.infer, ConfigDataTypes.unknown):
+        order_data_type = _sniff_config_data_type(data_source)  # type: ignore
+    resolve_order = _RESOLVE_ORDERS.get(order_data_type, _DEFAULT_RESOLVE_ORDER)
 
-        elif resolve_data_type == ConfigDataTypes.toml:
-            result = _load_dict_from_toml_stream_or_file(
-                file_path, determined_data_type, encoding=encoding
-            )
-            if result is not None:
-                return result
+    # without a key filter, the JSON parsers are faster than ijson and read mapped
+    # files without copying them
+    if (
+        ijson is not None
+        and key_filter is not None
+        and order_data_type == ConfigDataTypes.json
+        and isinstance(data_source, (io.BytesIO, mmap))
+    ):
+        result = _load_filtered_dict_from_json_stream(data_source, key_filter)
+        if result is not None:
+            return result
+    if key_filter is not None and order_data_type == ConfigDataTypes.yaml:
+        result = _load_filtered_dict_from_yaml_stream(data_source, key_filter)
+        if result is not None:
+            return result
 
-        elif resolve_data_type == ConfigDataTypes.yaml:
-            result = _load_dict_from_yaml_stream_or_file(
-                file_path, determined_data_type, encoding=encoding
-            )
-            if result is not None:
-                return result
+    # a known data type (given or determined by suffix) makes its parser raise a
+    # DictLoadError on syntax errors, so the remaining parsers are only tried for
+    # unknown data types or if the first parser returns None (eg. empty YAML document)
+    for loader in resolve_order:
+        result = loader(data_source, determined_data_type, encoding=encoding)
+        if result is not None:
+            if key_filter is not None and isinstance(result, dict):
+                return {key: value for key, value in result.items() if key in key_filter}
+            return result
 
     raise DictLoadError(
         message=(
             f"Format of config data {str(file_path)} (type {type(file_path)}) could not"
             " be determined to be one of"
-            f" [{', '.join(ConfigDataTypes.allowed_names())}]."
+            f" [{_ALLOWED_NAMES_JOINED}]."
+        ),
+        # streams may be closed by the caller before the document is accessed
+        document=data_source.read() if raw_content is None else None,  # type: ignore
+        document_provider=(
+            partial(_decode, raw_content[:_ERROR_DOCUMENT_SIZE], encoding, errors="replace")
+            if raw_content is not None
+            else None
         ),
-        document=file_path.read_text() if isinstance(file_path, Path) else file_path.read(),  # type: ignore
         position=0,
         line_number=0,
         column_number=0,
     )
 
 
+def _cached_load(
+    file_path: Union[str, Path],
+    data_type: ConfigDataTypes = ConfigDataTypes.infer,
+    encoding: str = "utf-8",
+) -> MutableMapping[str, Any]:
+    """Load a config file into a dictionary, re-using the parsed result of earlier
+    invocations as long as the file's modification time and size are unchanged.
+    Returns a deep copy, as the result gets mutated when merged into the settings.
+    Only small TOML and YAML files are cached: JSON is parsed faster than its result
+    could be deep-copied, and large files would keep their parsed content in memory.
+
+    Args:
+        file_path: path to the file to be parsed
+        data_type: see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+        encoding: see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+    Raises:
+        FileNotFoundError: if `file_path` does not exist
+        see [load_dict_from_file][pyconfme.config.config_file_loaders.load_dict_from_file]
+    Returns:
+        dictionary with parsed file content
+    """
+    # the stat result serves the cache key and, on a miss, the file checks of the load
+    file_stat = _stat_config_file(file_path)
+    effective_data_type = (
+        _determine_config_file_type(file_path)
+        if data_type == ConfigDataTypes.infer
+        else data_type
+    )
+    if (
+        effective_data_type not in _CACHED_DATA_TYPES
+        or file_stat.st_size > MMAP_THRESHOLD
+    ):
+        return _load_dict_from_path(Path(file_path), file_stat, data_type, encoding)
+    # the file is identified by device and inode, so that relative spellings of a path
+    # share an entry, and a relative path does not hit another file's entry after chdir
+    key = (
+        file_stat.st_dev,
+        file_stat.st_ino,
+        effective_data_type,
+        encoding,
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+    )
+    with _PARSE_CACHE_LOCK:
+        cached = key in _PARSE_CACHE
+        if cached:
+            _PARSE_CACHE.move_to_end(key)
+            result = _PARSE_CACHE[key]
+    if not cached:
+        result = _load_dict_from_path(Path(file_path), file_stat, data_type, encoding)
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = result
+            if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    return copy.deepcopy(result)
+
+
+def _load_config_data(
+    config_data: FilePathOrBuffer, data_type: ConfigDataTypes, encoding: str
+) -> Dict[str, Any]:
+    """Load one config data source for [_settings_config_load][pyconfme.config.config_file_loaders._settings_config_load].
+    Paths are loaded through [_cached_load][pyconfme.config.config_file_loaders._cached_load],
+    which only caches small TOML and YAML files, as this runs on every instantiation
+    of the settings class."""
+    return cast(
+        Dict[str, Any],
+        _cached_load(config_data, data_type, encoding=encoding)
+        if isinstance(config_data, (str, Path))
+        else load_dict_from_file(config_data, data_type, encoding=encoding),
+    )
+
+
+class _ErrorHandling(IntEnum):
+    """Error handling types of [_settings_config_load][pyconfme.config.config_file_loaders._settings_config_load]"""
+    abort = auto()
+    ignore = auto()
+    propagate = auto()
+
+
+def _error_handling_mode(error_handling: Optional[str]) -> _ErrorHandling:
+    """Map an error handling type name to its enum value; None maps to `propagate`.
+
+    Raises:
+        ValueError: if error_handling is not one of `["abort", "ignore", "propagate"]`
+    """
+    mode = _ErrorHandling.__members__.get(
+        "propagate" if error_handling is None else error_handling
+    )
+    if mode is None:
+        raise ValueError(
+            "Invalid error handling type. Expected one of:"
+            f" {list(_ErrorHandling.__members__)}"
+        )
+    return mode
+
+
 def _settings_config_load(
     settings: BaseSettings,
     file_path: Union[FilePathOrBuffer, Sequence[FilePathOrBuffer]] = None,
@@ -418,7 +1095,7 @@ def _settings_config_load(
         data_type: type of configuration data, if known or pre-defined
         encoding: encoding type passed to an open-function, in case path is given; ignored in case an already opened file/stream/buffer is given as `file_path`
         error_handling: one of `["abort", "ignore", "propagate"]`, where
-            `abort` calls `sys-exit()` on load error,
+            `abort` calls `sys.exit()` with the error message (printed to stderr, exit status 1) on load error,
             `ignore` does nothing and ultimatley returns an empty dictionary, if no data could be loaded and
             `propagate` raises the exceptions and leaves handling to the caller
             Default to `propagate`, if no value or `None` is given.
@@ -430,68 +1107,51 @@ def _settings_config_load(
         a dictionary with the values and structures read from the given file, stream or buffer
 
     """
-    allowed_error_handling = ["abort", "ignore", "propagate"]
-    if error_handling is None:
-        error_handling = "propagate"
-    if error_handling not in allowed_error_handling:
-        raise ValueError(
-            f"Invalid error handling type. Expected one of: {allowed_error_handling}"
-        )
+    mode = _error_handling_mode(error_handling)
 
     if file_path is None:
-        if error_handling == "abort":
-            print(f"File path is not a valid type.\nAbort!")
-            sys.exit()
-        elif error_handling == "propagate":
+        if mode is _ErrorHandling.abort:
+            sys.exit("File path is not a valid type.\nAbort!")
+        elif mode is _ErrorHandling.propagate:
             raise ValueError("File path is not a valid type.")
         else:
             return {}
-    config_data_elements: Sequence[FilePathOrBuffer] = list()
-    if isinstance(file_path, list):
-        config_data_elements = file_path
-    elif isinstance(file_path, tuple):
-        config_data_elements = list(file_path)
-    else:
-        config_data_elements = [file_path]  # type: ignore
+    config_data_elements: Sequence[FilePathOrBuffer] = (
+        file_path if isinstance(file_path, (list, tuple)) else (file_path,)  # type: ignore
+    )
 
     result_dict: Dict[str, Any] = {}
 
     for config_data in config_data_elements:
-        exists = False
-        if isinstance(config_data, str):
-            config_data = Path(config_data)
-        if isinstance(config_data, Path):
-            config_data = config_data.resolve()
-            exists = config_data.is_file()
-        else:
-            exists = True
+        try:
+            load_result = _load_config_data(config_data, data_type, encoding)
+            if result_dict or not isinstance(load_result, dict):
+                dict_deep_update(result_dict, load_result) # type: ignore
+            else:
+                # merging into an empty dictionary would only deep-copy the loaded
+                # dictionary, which is already a private copy
+                result_dict = load_result
 
-        if exists:
-            try:
-                load_result: Dict[str, Any] = cast(
-                    Dict[str, Any],
-                    load_dict_from_file(config_data, data_type, encoding=encoding),
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            # sources that do not exist or are no files are silently discarded
+            pass
+
+        except DictLoadError as e:
+            if mode is _ErrorHandling.abort:
+                sys.exit(
+                    f"{e.message}\nContext:\n{e.document}\nPosition ="
+                    f" {e.position}, line number = {e.line_number},"
+                    f" column_number = {e.column_number}"
                 )
-                dict_deep_update(result_dict, load_result) # type: ignore
+            elif mode is _ErrorHandling.propagate:
+                raise e
 
-            except DictLoadError as e:
-                if error_handling == "abort":
-                    print(
-                        f"{e.message}\nContext:\n{e.document}\nPosition ="
-                        f" {e.position}, line number = {e.line_number},"
-                        f" column_number = {e.column_number}"
-                    )
-                    sys.exit()
-                elif error_handling == "propagate":
-                    raise e
-
-            except IOError as e:
-                # catch permission errors, which are propagated instead of returning false for is_file()
-                if error_handling == "abort":
-                    print(f"{e}\nAbort!")
-                    sys.exit()
-                elif error_handling == "propagate":
-                    raise e
+        except IOError as e:
+            # catch permission errors, which are propagated instead of returning false for is_file()
+            if mode is _ErrorHandling.abort:
+                sys.exit(f"{e}\nAbort!")
+            elif mode is _ErrorHandling.propagate:
+                raise e
 
     return result_dict
 
@@ -510,7 +1170,7 @@ def get_settings_config_load_function(
         data_type: type of configuration data, if known/pre-defined
         encoding: encoding type passed to an open-function, in case path is given; ignored in case an already opened file/stream/buffer is given as `file_path`
         error_handling: one of `["abort", "ignore", "propagate"]`, where
-            `abort` calls `sys-exit()` on load error,
+            `abort` calls `sys.exit()` with the error message (printed to stderr, exit status 1) on load error,
             `ignore` does nothing and ultimatley returns an empty dictionary, if no data could be loaded and
             `propagate` raises the exceptions and leaves handling to the caller
     Raises:
@@ -562,6 +1222,8 @@ def get_settings_config_load_function(
 
     ```
     """
+    # fail on an invalid error handling type already when the settings class is defined
+    _error_handling_mode(error_handling)
     return partial(
         _settings_config_load,
         file_path=file_path,
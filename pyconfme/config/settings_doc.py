@@ -1,6 +1,7 @@
 # from https://github.com/danields761/pydantic-settings
 
 from typing import Callable, Optional, Type, TypeVar, Union, overload
+from weakref import WeakKeyDictionary
 
 from class_doc import extract_docs_from_cls_obj
 
@@ -57,7 +58,9 @@ AnyModelType = Type[Union[BaseModel, DataclassProtocol]]
 
 
 def is_pydantic_dataclass(cls: Type) -> bool:
-    return isinstance(cls, PydanticDataclass)
+    # checking the runtime protocol with isinstance() probes every protocol member and
+    # fails for dataclass types, as `__initialised__` is only set on their instances
+    return hasattr(cls, '__pydantic_model__') and hasattr(cls, '__dataclass_fields__')
 
 
 JsonLocation = Sequence[Union[str, int]]
@@ -104,6 +107,22 @@ AnySourceLocProvider = Union[
 ]
 
 
+_ATTRIBUTES_DOCS_CACHE: 'WeakKeyDictionary[type, Dict[str, List[str]]]' = (
+    WeakKeyDictionary()
+)
+
+
+def _extract_attributes_docs(model: type) -> Dict[str, List[str]]:
+    """
+    Extract attributes documentation of a class once; parsing the class source is
+    expensive and the result does not change for the same class object.
+    """
+    docs = _ATTRIBUTES_DOCS_CACHE.get(model)
+    if docs is None:
+        docs = _ATTRIBUTES_DOCS_CACHE[model] = extract_docs_from_cls_obj(model)
+    return docs
+
+
 def apply_attributes_docs(
     model: Type[AnyPydanticModel], *, override_existing: bool = True
 ) -> None:
@@ -119,7 +138,7 @@ def apply_attributes_docs(
         )
         return
 
-    docs = extract_docs_from_cls_obj(model)
+    docs = _extract_attributes_docs(model)
 
     for field in model.__fields__.values():
         if field.field_info.description and not override_existing:
@@ -1,10 +1,33 @@
 import copy
-from typing import Dict, Any, List, Set, TypeVar, cast
+from typing import Dict, Iterator, List, Optional, Tuple, cast
 
 #: :obj:`int` :
 #: Maximum depth to which dictionaries are merged
 MAX_RECURSION_DEPTH: int = 8
 
+# marks keys missing in the target dictionary, as None is a valid value
+_MISSING = object()
+
+# value types that can be shared between source and target, as they cannot be mutated
+_IMMUTABLE_VALUE_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _copy_value(value: object) -> object:
+    """Copy a list, dictionary or set from source for the target dictionary. Flat
+    containers holding only immutable values, the common case in settings files, are
+    copied shallowly, which is equivalent to but much cheaper than `copy.deepcopy`."""
+    value_type = type(value)
+    if value_type is dict:
+        if all(
+            type(key) in _IMMUTABLE_VALUE_TYPES and type(item) in _IMMUTABLE_VALUE_TYPES
+            for key, item in cast(Dict[object, object], value).items()
+        ):
+            return cast(Dict[object, object], value).copy()
+    elif value_type is list or value_type is set:
+        if all(type(item) in _IMMUTABLE_VALUE_TYPES for item in value):  # type: ignore
+            return value.copy()  # type: ignore
+    return copy.deepcopy(value)
+
 
 def dict_deep_update(
     target: Dict[object, object], source: Dict[object, object], recursion_depth: int = 0
@@ -33,45 +56,58 @@ def dict_deep_update(
     {'name': 'Ferry', 'hobbies': ['programming', 'sci-fi', 'gaming']}
     """
     recursion_depth = recursion_depth if recursion_depth >= 0 else 0
-    if recursion_depth > MAX_RECURSION_DEPTH:
-        raise RecursionError(
-            f"Exceeded maximum recursion depth == {MAX_RECURSION_DEPTH}. Reduce depth"
-            " of source dictionary."
-        )
     if target is None:
         raise ValueError("Target dictionary is None.")
     if source is None:
         raise ValueError("Source dictionary is None.")
-    if source == {}:
-        target.clear()
-    else:
-        for source_key, source_value in source.items():
-            if isinstance(source_value, List):
-                if not source_key in target:
-                    target[source_key] = copy.deepcopy(source_value)
-                elif isinstance(target[source_key], List):
-                    cast(List[object], target[source_key]).extend(source_value)
-                else:
-                    target[source_key] = copy.deepcopy(source_value)
-            elif isinstance(source_value, Dict):
-                if not source_key in target:
-                    target[source_key] = copy.deepcopy(source_value)
-                elif isinstance(target[source_key], Dict):
-                    dict_deep_update(
-                        cast(Dict[object, object], target[source_key]),
-                        source_value,
-                        recursion_depth=recursion_depth + 1,
-                    )
+    # nested dictionaries are merged depth-first in source order, like recursive calls
+    # would do, but with an explicit stack of (target, source items, depth) entries
+    stack: List[Tuple[Dict[object, object], Iterator[Tuple[object, object]], int]] = []
+    next_source: Optional[Dict[object, object]] = source
+    while True:
+        if next_source is not None:
+            if recursion_depth > MAX_RECURSION_DEPTH:
+                raise RecursionError(
+                    f"Exceeded maximum recursion depth == {MAX_RECURSION_DEPTH}. Reduce"
+                    " depth of source dictionary."
+                )
+            if next_source == {}:
+                target.clear()
+            else:
+                stack.append((target, iter(next_source.items()), recursion_depth))
+            next_source = None
+        if not stack:
+            return
+        target, source_items, recursion_depth = stack[-1]
+        for source_key, source_value in source_items:
+            # single lookup of the target value per key
+            target_value = target.get(source_key, _MISSING)
+            if isinstance(source_value, list):
+                if isinstance(target_value, list):
+                    target_value.extend(source_value)
                 else:
-                    target[source_key] = copy.deepcopy(source_value)
-            elif isinstance(source_value, Set):
-                if not source_key in target:
+                    target[source_key] = _copy_value(source_value)
+            elif isinstance(source_value, dict):
+                if isinstance(target_value, dict):
+                    # descend, the remaining items of this level continue afterwards
+                    target = cast(Dict[object, object], target_value)
+                    next_source = source_value
+                    recursion_depth += 1
+                    break
+                target[source_key] = _copy_value(source_value)
+            elif isinstance(source_value, set):
+                if target_value is _MISSING:
                     target[source_key] = source_value.copy()
-                elif isinstance(target[source_key], Set):
-                    cast(Set[object], target[source_key]).update(source_value.copy())
+                elif isinstance(target_value, set):
+                    target_value.update(source_value)
                 else:
-                    target[source_key] = copy.deepcopy(source_value)
+                    target[source_key] = _copy_value(source_value)
             elif source_value is None:
                 target[source_key] = None
+            elif type(source_value) in _IMMUTABLE_VALUE_TYPES:
+                # copy.copy() would return the very same object anyway
+                target[source_key] = source_value
             else:
-                target[source_key] = copy.copy(source_value)
\ No newline at end of file
+                target[source_key] = copy.copy(source_value)
+        else:
+            stack.pop()
@@ -11,7 +11,11 @@ import sys
 from pyconfme.config.config_data_types import ConfigDataTypes
 from pyconfme.config.click_config_option import (
     click_config_option,
+    _format_dict_load_error,
+    _has_only_scalar_defaults,
+    DOCUMENT_CONTEXT_WINDOW,
 )
+from pyconfme.config.config_file_loaders import DictLoadError
 
 
 class DummyRunserverSettings(BaseSettings):
@@ -71,3 +75,201 @@ def _inner_test(
                 )
                 == resulting_dict
             )
+
+
+def test_click_config_option_multiple_files():
+    import click
+    from click.testing import CliRunner
+
+    settings = DummySettings()
+
+    @click.command()
+    @click_config_option(settings, DummySettings)
+    def cli(config):
+        click.echo(f"{config.dict()}")
+
+    dirpath = mkdtemp()
+    temp_config_name = Path(dirpath) / "config.json"
+    temp_config_name.write_text('{"runserver": {"port": 4444}}')
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "--config",
+            "tests/config/example_cfg1.yaml",
+            "--config",
+            str(temp_config_name),
+        ],
+    )
+    rmtree(dirpath)
+    assert result.exit_code == 0
+    assert result.stdout == "{'runserver': {'port': 4444}}\n"
+
+
+def test_click_config_option_validation_error():
+    import click
+    from click.testing import CliRunner
+
+    settings = DummySettings()
+
+    @click.command()
+    @click_config_option(settings, DummySettings)
+    def cli(config):
+        click.echo(f"{config.dict()}")
+
+    dirpath = mkdtemp()
+    temp_config_name = Path(dirpath) / "config.yaml"
+    temp_config_name.write_text("runserver:\n    port: notanumber\n")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config", str(temp_config_name)])
+    rmtree(dirpath)
+    assert result.exit_code != 0
+    assert "Validation error for config file(s)" in result.stdout
+
+
+def test_click_config_option_stops_at_malformed_file(monkeypatch):
+    import click
+    from click.testing import CliRunner
+    from pyconfme.config import click_config_option as click_config_option_module
+
+    loaded = []
+    cached_load = click_config_option_module._cached_load
+
+    def recording_cached_load(config_file):
+        loaded.append(Path(config_file).name)
+        return cached_load(config_file)
+
+    monkeypatch.setattr(click_config_option_module, "_cached_load", recording_cached_load)
+    settings = DummySettings()
+
+    @click.command()
+    @click_config_option(settings, DummySettings)
+    def cli(config):
+        click.echo(f"{config.dict()}")
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "--config",
+            "tests/config/example_malformed_cfg1.yaml",
+            "--config",
+            "tests/config/example_cfg1.yaml",
+        ],
+    )
+    assert result.exit_code != 0
+    assert loaded == ["example_malformed_cfg1.yaml"]
+
+
+def test_click_config_option_trust_input():
+    import click
+    from click.testing import CliRunner
+
+    class FlatSettings(BaseSettings):
+        debug: bool = False
+        port: int = 1234
+
+    settings = FlatSettings()
+
+    @click.command()
+    @click_config_option(settings, FlatSettings, trust_input=True)
+    def cli(config):
+        click.echo(f"{config.dict()}")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config", "tests/config/example_cfg4.ini"])
+    assert result.exit_code == 0
+    assert result.stdout == "{'debug': False, 'port': 4242}\n"
+    assert settings.port == 1234
+
+
+def test_format_dict_load_error_truncates_document():
+    document = "a" * 1000 + "X" + "b" * 1000
+    message = _format_dict_load_error(
+        DictLoadError(
+            "error",
+            position=1000,
+            document=document,
+            line_number=1,
+            column_number=1001,
+        )
+    )
+    assert "a" * DOCUMENT_CONTEXT_WINDOW + "X" + "b" * (DOCUMENT_CONTEXT_WINDOW - 1) in message
+    assert "a" * (DOCUMENT_CONTEXT_WINDOW + 1) not in message
+    assert message.startswith("error\nContext:\n")
+    assert message.endswith("Position = 1000, line number = 1, column_number = 1001")
+
+
+def test_format_dict_load_error_without_document():
+    assert _format_dict_load_error(DictLoadError("error")).startswith(
+        "error\nContext:\nNone\n"
+    )
+
+
+def test_has_only_scalar_defaults():
+    class FlatSettings(BaseSettings):
+        debug: bool = False
+        port: int = 1234
+
+    class ListSettings(BaseSettings):
+        hosts: list = ["localhost"]
+
+    assert _has_only_scalar_defaults(FlatSettings())
+    assert not _has_only_scalar_defaults(FlatSettings(port=42))
+    assert not _has_only_scalar_defaults(ListSettings())
+    assert not _has_only_scalar_defaults(DummySettings())
+
+
+def test_click_config_option_on_subcommands():
+    import click
+    from click.testing import CliRunner
+
+    settings = DummySettings()
+
+    @click.group()
+    def cli():
+        pass
+
+    @cli.command()
+    @click_config_option(settings, DummySettings)
+    def first(config):
+        click.echo(f"first {config.dict()}")
+
+    @cli.command()
+    @click_config_option(settings, DummySettings)
+    def second(config):
+        click.echo(f"second {config.dict()}")
+
+    runner = CliRunner()
+    for name in ["first", "second"]:
+        result = runner.invoke(
+            cli, [name, "--config", "tests/config/example_cfg1.yaml"]
+        )
+        assert result.exit_code == 0
+        assert result.stdout == f"{name} {{'runserver': {{'port': 3333}}}}\n"
+
+
+@pytest.mark.parametrize(
+    "option_name, option_short, args",
+    [
+        ("config", "", ["-c", "tests/config/example_cfg1.yaml"]),
+        ("--config", "", ["-c", "tests/config/example_cfg1.yaml"]),
+        ("--settings", "-x", ["-x", "tests/config/example_cfg1.yaml"]),
+        ("settings", "", ["--settings", "tests/config/example_cfg1.yaml"]),
+    ],
+)
+def test_click_config_option_names(option_name, option_short, args):
+    import click
+    from click.testing import CliRunner
+
+    settings = DummySettings()
+
+    @click.command()
+    @click_config_option(
+        settings, DummySettings, option_name=option_name, option_short=option_short
+    )
+    def cli(**kwargs):
+        click.echo(f"{kwargs[option_name.lstrip('-')].dict()}")
+
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0
+    assert result.stdout == "{'runserver': {'port': 3333}}\n"
@@ -1,15 +1,26 @@
 import pytest
+import sys
 from pathlib import Path
 from hypothesis import given, strategies as st
 from string import printable
-from io import StringIO
+from io import BytesIO, StringIO
+import codecs
+import copy
+import pickle
+from collections import OrderedDict
 import mmap
+import json
 
 from pyconfme.config.config_data_types import ConfigDataTypes
 from pyconfme.config.config_file_loaders import (
     DictLoadError,
+    _cached_load,
+    MMAP_THRESHOLD,
     _determine_config_file_type,
+    _sniff_config_data_type,
     load_dict_from_file,
+    load_dict_from_string,
+    _load_filtered_dict_from_file,
     _load_dict_from_json_stream_or_file,
     _load_dict_from_toml_stream_or_file,
     _load_dict_from_yaml_stream_or_file,
@@ -42,6 +53,12 @@ def _get_mmap(file_path):
     return mmap.mmap(f.fileno(), 0)
 
 
+def _open_lazily(file_path):
+    # files and mmaps are given as factories, so they are only opened by the test using
+    # them instead of all at once during collection
+    return file_path() if callable(file_path) else file_path
+
+
 @pytest.mark.parametrize(
     "file_path, expected_exception, data_type, resulting_dict",
     [
@@ -49,7 +66,7 @@ def _get_mmap(file_path):
         (Path("does_not_exist.unknown"), FileNotFoundError, None, {}),
         (Path("tests/config"), IsADirectoryError, None, {}),
         (Path("tests/config/example_malformed_cfg3.json"), None, None, None),
-        (open("tests/config/example_malformed_cfg3.json"), None, None, None),
+        (lambda: open("tests/config/example_malformed_cfg3.json"), None, None, None),
         (
             Path("tests/config/example_malformed_cfg3.json"),
             DictLoadError,
@@ -69,19 +86,19 @@ def _get_mmap(file_path):
             {"main": "started", "runserver": {"nested_list": [42, 96]}},
         ),
         (
-            open("tests/config/example_cfg3.json"),
+            lambda: open("tests/config/example_cfg3.json"),
             None,
             ConfigDataTypes.json,
             {"main": "started", "runserver": {"nested_list": [42, 96]}},
         ),
         (
-            open("tests/config/example_cfg3.json", "r+b"),
+            lambda: open("tests/config/example_cfg3.json", "r+b"),
             None,
             ConfigDataTypes.json,
             {"main": "started", "runserver": {"nested_list": [42, 96]}},
         ),
         (
-            _get_mmap("tests/config/example_cfg3.json"),
+            lambda: _get_mmap("tests/config/example_cfg3.json"),
             None,
             ConfigDataTypes.json,
             {"main": "started", "runserver": {"nested_list": [42, 96]}},
@@ -110,6 +127,7 @@ def _get_mmap(file_path):
 def test_load_dict_from_json_stream_or_file(
     file_path, expected_exception, data_type, resulting_dict
 ):
+    file_path = _open_lazily(file_path)
     if expected_exception is None:
         if data_type is None:
             assert _load_dict_from_json_stream_or_file(file_path) == resulting_dict
@@ -137,7 +155,7 @@ def test_load_dict_from_json_stream_or_file(
         (Path("does_not_exist.unknown"), FileNotFoundError, None, {}),
         (Path("tests/config"), IsADirectoryError, None, {}),
         (Path("tests/config/example_malformed_cfg2.toml"), None, None, None),
-        (open("tests/config/example_malformed_cfg2.toml"), None, None, None),
+        (lambda: open("tests/config/example_malformed_cfg2.toml"), None, None, None),
         (
             Path("tests/config/example_malformed_cfg2.toml"),
             DictLoadError,
@@ -157,19 +175,19 @@ def test_load_dict_from_json_stream_or_file(
             {"runserver": {"user": "someone"}},
         ),
         (
-            open("tests/config/example_cfg2.toml"),
+            lambda: open("tests/config/example_cfg2.toml"),
             None,
             ConfigDataTypes.toml,
             {"runserver": {"user": "someone"}},
         ),
         (
-            open("tests/config/example_cfg2.toml", "r+b"),
+            lambda: open("tests/config/example_cfg2.toml", "r+b"),
             None,
             ConfigDataTypes.toml,
             {"runserver": {"user": "someone"}},
         ),
         (
-            _get_mmap("tests/config/example_cfg2.toml"),
+            lambda: _get_mmap("tests/config/example_cfg2.toml"),
             None,
             ConfigDataTypes.toml,
             {"runserver": {"user": "someone"}},
@@ -193,6 +211,7 @@ def test_load_dict_from_json_stream_or_file(
 def test_load_dict_from_toml_stream_or_file(
     file_path, expected_exception, data_type, resulting_dict
 ):
+    file_path = _open_lazily(file_path)
     if expected_exception is None:
         if data_type is None:
             assert _load_dict_from_toml_stream_or_file(file_path) == resulting_dict
@@ -220,7 +239,7 @@ def test_load_dict_from_toml_stream_or_file(
         (Path("does_not_exist.unknown"), FileNotFoundError, None, {}),
         (Path("tests/config"), IsADirectoryError, None, {}),
         (Path("tests/config/example_malformed_cfg1.yaml"), None, None, None),
-        (open("tests/config/example_malformed_cfg1.yaml"), None, None, None),
+        (lambda: open("tests/config/example_malformed_cfg1.yaml"), None, None, None),
         (
             Path("tests/config/example_malformed_cfg1.yaml"),
             DictLoadError,
@@ -240,19 +259,19 @@ def test_load_dict_from_toml_stream_or_file(
             {"runserver": {"port": 3333}},
         ),
         (
-            open("tests/config/example_cfg1.yaml"),
+            lambda: open("tests/config/example_cfg1.yaml"),
             None,
             ConfigDataTypes.yaml,
             {"runserver": {"port": 3333}},
         ),
         (
-            open("tests/config/example_cfg1.yaml", "r+b"),
+            lambda: open("tests/config/example_cfg1.yaml", "r+b"),
             None,
             ConfigDataTypes.yaml,
             {"runserver": {"port": 3333}},
         ),
         (
-            _get_mmap("tests/config/example_cfg1.yaml"),
+            lambda: _get_mmap("tests/config/example_cfg1.yaml"),
             None,
             ConfigDataTypes.yaml,
             {"runserver": {"port": 3333}},
@@ -276,6 +295,7 @@ def test_load_dict_from_toml_stream_or_file(
 def test_load_dict_from_yaml_stream_or_file(
     file_path, expected_exception, data_type, resulting_dict
 ):
+    file_path = _open_lazily(file_path)
     if expected_exception is None:
         if data_type is None:
             assert _load_dict_from_yaml_stream_or_file(file_path) == resulting_dict
@@ -388,14 +408,14 @@ def test_load_dict_from_yaml_stream_or_file(
             {"runserver": {"port": 3333}},
         ),
         (
-            open("tests/config/example_cfg1.yaml", "r+b"),
+            lambda: open("tests/config/example_cfg1.yaml", "r+b"),
             None,
             ConfigDataTypes.yaml,
             "utf-8",
             {"runserver": {"port": 3333}},
         ),
         (
-            open("tests/config/example_cfg1.yaml", "r+b"),
+            lambda: open("tests/config/example_cfg1.yaml", "r+b"),
             None,
             ConfigDataTypes.yaml,
             "utf-16",
@@ -441,6 +461,7 @@ def test_load_dict_from_yaml_stream_or_file(
 def test_load_dict_from_file(
     file_path, expected_exception, data_type, encoding, resulting_dict
 ):
+    file_path = _open_lazily(file_path)
     if expected_exception is None:
         if data_type is None:
             assert load_dict_from_file(file_path, encoding=encoding) == resulting_dict
@@ -462,19 +483,324 @@ def test_load_dict_from_file_exceeding_maxfilesize():
         _ = load_dict_from_file(Path("tests/config/example_cfg1.yaml"), max_file_size=1)
 
 
-@st.composite
-def fspath_strategy(draw, path_elements=st.text(printable)):
-    count_path_elements = draw(st.integers(min_value=0, max_value=5))
-    path = Path()
-    for _ in range(count_path_elements):
-        path = path / Path(draw(path_elements))
-    return Path(path)
+# paths of up to five random elements, drawn as a single list
+fspath_strategy = st.lists(st.text(printable), max_size=5).map(lambda parts: Path(*parts))
 
 
 @given(
-    file_path=fspath_strategy(),
+    file_path=fspath_strategy,
     data_type=st.sampled_from([el for el in ConfigDataTypes]),
 )
 def test_fuzzy_load_dict_from_file(file_path, data_type):
     with pytest.raises((FileNotFoundError, IsADirectoryError)):
         _ = load_dict_from_file(file_path, data_type)
+
+
+def test_toml_decode_error_position():
+    with pytest.raises(DictLoadError) as exc_info:
+        _load_dict_from_toml_stream_or_file(
+            StringIO("[runserver]\nuser = someone"), ConfigDataTypes.toml
+        )
+    assert exc_info.value.line_number == 2
+    assert exc_info.value.column_number == 8
+    assert exc_info.value.document[exc_info.value.position :] == "someone"
+
+
+def test_json_non_strict_document():
+    # not accepted by orjson, but by the standard library
+    assert _load_dict_from_json_stream_or_file(
+        StringIO('{"value": NaN}'), ConfigDataTypes.json
+    )["value"] != 0
+
+
+@pytest.mark.parametrize(
+    "document, resulting_type",
+    [
+        ('{"runserver": {"port": 1}}', ConfigDataTypes.json),
+        ("[1, 2]", ConfigDataTypes.json),
+        ("\ufeff# comment\n\n[runserver]\nport = 1", ConfigDataTypes.toml),
+        ("port = 1", ConfigDataTypes.toml),
+        ("---\nport: 1", ConfigDataTypes.yaml),
+        ("runserver:\n  port: 1", ConfigDataTypes.yaml),
+        ("", ConfigDataTypes.unknown),
+        ("just text", ConfigDataTypes.unknown),
+    ],
+)
+def test_sniff_config_data_type(document, resulting_type):
+    stream = StringIO(document)
+    assert _sniff_config_data_type(stream) == resulting_type
+    assert stream.tell() == 0
+
+
+def test_load_dict_from_file_error_document(tmp_path):
+    config_file = tmp_path / "config.unknown"
+    config_file.write_text("{ not: [ parseable")
+    with pytest.raises(DictLoadError) as exc_info:
+        load_dict_from_file(config_file)
+    assert exc_info.value.document == "{ not: [ parseable"
+
+
+@pytest.mark.parametrize(
+    "suffix, line_template",
+    [
+        (".json", None),
+        (".toml", 'key{} = "{}"\n'),
+        (".yaml", "key{}: {}\n"),
+    ],
+)
+def test_load_dict_from_file_exceeding_mmap_threshold(tmp_path, suffix, line_template):
+    content = {f"key{i}": "x" * 64 for i in range(2000)}
+    config_file = tmp_path / f"config{suffix}"
+    if line_template is None:
+        config_file.write_text(json.dumps(content))
+    else:
+        config_file.write_text(
+            "".join(line_template.format(i, "x" * 64) for i in range(2000))
+        )
+    assert config_file.stat().st_size > MMAP_THRESHOLD
+    assert load_dict_from_file(config_file) == content
+
+
+def test_load_dict_from_file_unmappable(tmp_path, monkeypatch):
+    from pyconfme.config import config_file_loaders
+
+    # an invalid access mode makes mmap fail, like eg. on file systems without mmap support
+    monkeypatch.setattr(config_file_loaders, "ACCESS_READ", -1)
+    content = {f"key{i}": "x" * 64 for i in range(2000)}
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(content))
+    assert config_file.stat().st_size > MMAP_THRESHOLD
+    assert load_dict_from_file(config_file) == content
+
+
+def test_cached_load(tmp_path):
+    temp_config_name = tmp_path / "config.yaml"
+    temp_config_name.write_text("runserver:\n  port: 4444")
+    first = _cached_load(temp_config_name)
+    first["runserver"]["port"] = 1
+    assert _cached_load(temp_config_name) == {"runserver": {"port": 4444}}
+    temp_config_name.write_text("runserver:\n  port: 55555")
+    assert _cached_load(temp_config_name) == {"runserver": {"port": 55555}}
+
+
+@pytest.mark.parametrize(
+    "file_name, content",
+    [
+        # JSON is parsed faster than a cached result is copied
+        ("config.json", '{"runserver": {"port": 4444}}'),
+        # large files are not kept in memory
+        ("config.yaml", "runserver:\n  port: 4444\n#" + "x" * MMAP_THRESHOLD),
+    ],
+)
+def test_cached_load_bypass(tmp_path, file_name, content):
+    from pyconfme.config import config_file_loaders
+
+    temp_config_name = tmp_path / file_name
+    temp_config_name.write_text(content)
+    assert _cached_load(temp_config_name) == {"runserver": {"port": 4444}}
+    file_stat = temp_config_name.stat()
+    assert not any(
+        key[:2] == (file_stat.st_dev, file_stat.st_ino)
+        for key in config_file_loaders._PARSE_CACHE
+    )
+
+
+def test_cached_load_relative_paths(tmp_path, monkeypatch):
+    from pyconfme.config import config_file_loaders
+
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    (tmp_path / "first" / "config.yaml").write_text("runserver:\n  port: 1111")
+    (tmp_path / "second" / "config.yaml").write_text("runserver:\n  port: 2222")
+    monkeypatch.setattr(config_file_loaders, "_PARSE_CACHE", OrderedDict())
+    monkeypatch.chdir(tmp_path / "first")
+    # different spellings of the same file share one cache entry
+    assert _cached_load("config.yaml") == {"runserver": {"port": 1111}}
+    assert _cached_load("./../first/config.yaml") == {"runserver": {"port": 1111}}
+    assert len(config_file_loaders._PARSE_CACHE) == 1
+    # the same relative path names another file after changing the directory
+    monkeypatch.chdir(tmp_path / "second")
+    assert _cached_load("config.yaml") == {"runserver": {"port": 2222}}
+
+
+def test_load_dict_from_file_duck_typed_stream():
+    # stream readers, which are no io.IOBase instances
+    stream = codecs.getreader("utf-8")(BytesIO(b'{"runserver": {"port": 1}}'))
+    assert load_dict_from_file(stream) == {"runserver": {"port": 1}}
+
+
+@pytest.mark.parametrize(
+    "document, suffix, expected_exception",
+    [
+        ('{"runserver": {"port": 1}, "other": [1, {"a": 2}]}', ".json", None),
+        ('{"runserver": {"port": 1}, "other": NaN}', ".json", None),
+        ("runserver:\n  port: 1\nother: 2", ".yaml", None),
+        ("defaults: &port\n  port: 1\nrunserver: *port", ".yaml", None),
+        ("other: 2\n<<: {runserver: {port: 1}}", ".yaml", None),
+        # the last of duplicate keys wins, as in the unfiltered load
+        ("runserver: 1\nother: 2\nrunserver: {port: 1}", ".yaml", None),
+        # further documents fail as in the unfiltered load
+        ("runserver: {port: 1}\n---\nb: 2", ".yaml", DictLoadError),
+    ],
+)
+def test_load_filtered_dict_from_file(
+    tmp_path, document, suffix, expected_exception
+):
+    config_file = tmp_path / f"config{suffix}"
+    config_file.write_text(document)
+    if expected_exception is None:
+        assert _load_filtered_dict_from_file(config_file, {"runserver"}) == {
+            "runserver": {"port": 1}
+        }
+    else:
+        with pytest.raises(expected_exception):
+            _load_filtered_dict_from_file(config_file, {"runserver"})
+
+
+def test_load_dict_from_file_known_type_no_fallback(tmp_path):
+    # valid YAML, but invalid JSON: the suffix decides and no other parser is tried
+    config_file = tmp_path / "config.json"
+    config_file.write_text("runserver:\n  port: 1")
+    with pytest.raises(DictLoadError):
+        load_dict_from_file(config_file)
+
+
+@pytest.fixture(params=["optional", "fallback"])
+def parser_backends(request, monkeypatch):
+    """Run a test with the optional parsers, if installed, and with the fallback
+    parsers of the standard library and the declared dependencies."""
+    from pyconfme.config import config_file_loaders
+
+    if request.param == "fallback":
+        for backend in ("orjson", "tomllib", "ijson"):
+            monkeypatch.setattr(config_file_loaders, backend, None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "file_path, resulting_dict",
+    [
+        (
+            Path("tests/config/example_cfg2.toml"),
+            {"runserver": {"user": "someone"}},
+        ),
+        (
+            Path("tests/config/example_cfg3.json"),
+            {"main": "started", "runserver": {"nested_list": [42, 96]}},
+        ),
+    ],
+)
+def test_load_dict_from_file_parser_backends(parser_backends, file_path, resulting_dict):
+    assert load_dict_from_file(file_path) == resulting_dict
+
+
+@pytest.mark.parametrize(
+    "file_path, line_number",
+    [
+        (Path("tests/config/example_malformed_cfg2.toml"), 1),
+        (Path("tests/config/example_malformed_cfg3.json"), 8),
+    ],
+)
+def test_load_dict_from_file_parser_backends_error(
+    parser_backends, file_path, line_number
+):
+    # error messages and columns differ between the parsers, the line does not
+    with pytest.raises(DictLoadError) as exc_info:
+        load_dict_from_file(file_path)
+    assert exc_info.value.line_number == line_number
+
+
+def test_toml_parser_selection():
+    from pyconfme.config import config_file_loaders
+
+    # the standard library's parser from Python 3.11 on, its backport tomli before,
+    # if installed, otherwise the toml package
+    if sys.version_info >= (3, 11):
+        import tomllib as expected_parser
+    else:
+        try:
+            import tomli as expected_parser
+        except ImportError:
+            expected_parser = None
+    assert config_file_loaders.tomllib is expected_parser
+
+
+def test_dict_load_error_document_provider():
+    calls = []
+
+    def provider():
+        calls.append(1)
+        return "document"
+
+    error = DictLoadError(message="error", document_provider=provider)
+    assert calls == []
+    assert error.document == "document"
+    assert error.document == "document"
+    assert calls == [1]
+
+
+@pytest.mark.parametrize("copy_error", [copy.copy, lambda error: pickle.loads(pickle.dumps(error))])
+@pytest.mark.parametrize(
+    "error",
+    [
+        DictLoadError("error", 3, "document", 1, 4),
+        DictLoadError("error", 3, line_number=1, column_number=4, document_provider=lambda: "document"),
+    ],
+)
+def test_dict_load_error_copy(copy_error, error):
+    copied = copy_error(error)
+    assert type(copied) is DictLoadError
+    assert copied.args == ("error",)
+    assert (copied.message, copied.position, copied.document) == ("error", 3, "document")
+    assert (copied.line_number, copied.column_number) == (1, 4)
+
+
+@pytest.mark.parametrize(
+    "document, data_type, resulting_dict",
+    [
+        ('{"runserver": {"port": 1}}', ConfigDataTypes.infer, {"runserver": {"port": 1}}),
+        (b"[runserver]\nport = 1", ConfigDataTypes.infer, {"runserver": {"port": 1}}),
+        ("runserver:\n  port: 1", ConfigDataTypes.yaml, {"runserver": {"port": 1}}),
+    ],
+)
+def test_load_dict_from_string(document, data_type, resulting_dict):
+    assert load_dict_from_string(document, data_type) == resulting_dict
+
+
+@pytest.mark.parametrize(
+    "document, data_type",
+    [
+        ('{"name": "Jürgen"}', ConfigDataTypes.json),
+        ('{"name": "Jürgen"}', ConfigDataTypes.infer),
+        ('name = "Jürgen"', ConfigDataTypes.toml),
+        ('name = "Jürgen"', ConfigDataTypes.infer),
+        ("name: Jürgen", ConfigDataTypes.yaml),
+        ("name: Jürgen", ConfigDataTypes.infer),
+    ],
+)
+def test_load_dict_from_string_non_utf8_bytes(document, data_type):
+    assert load_dict_from_string(
+        document.encode("latin-1"), data_type, encoding="latin-1"
+    ) == {"name": "Jürgen"}
+
+
+def test_load_dict_from_string_error():
+    with pytest.raises(DictLoadError) as exc_info:
+        load_dict_from_string("{ not: [ parseable")
+    assert exc_info.value.document == "{ not: [ parseable"
+
+
+@pytest.mark.parametrize(
+    "document, resulting_dict",
+    [
+        ('{"runserver": {"port": 1}}', {"runserver": {"port": 1}}),
+        # flow-style YAML, which is no valid JSON
+        ("{runserver: {port: 1}}", {"runserver": {"port": 1}}),
+        # valid JSON, but with a different meaning in YAML
+        ('{"a": NaN, "b": 1e3}', {"a": "NaN", "b": "1e3"}),
+    ],
+)
+def test_load_dict_from_file_json_like_yaml(tmp_path, document, resulting_dict):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(document)
+    assert load_dict_from_file(config_file) == resulting_dict
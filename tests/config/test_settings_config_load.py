@@ -39,6 +39,9 @@ def _inner_test(
     resulting_dict,
     function_in_test = _settings_config_load
 ):
+    # files are given as factories, so they are only opened by the test using them
+    if callable(file_path):
+        file_path = file_path()
     if expected_exception is None:
         assert (
             function_in_test(
@@ -97,7 +100,7 @@ def _inner_test(
             None,
         ),
         (
-            open("tests/config/example_malformed_cfg3.json"),
+            lambda: open("tests/config/example_malformed_cfg3.json"),
             DictLoadError,
             None,
             None,
@@ -129,7 +132,7 @@ def _inner_test(
             {"main": "started", "runserver": {"nested_list": [42, 96]}},
         ),
         (
-            open("tests/config/example_cfg3.json", "r+b"),
+            lambda: open("tests/config/example_cfg3.json", "r+b"),
             None,
             ConfigDataTypes.json,
             None,
@@ -221,8 +224,9 @@ def test__settings_config_load(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_file_path():
+    # the tests only try to read the write-only file, so they can share it
     dirpath = mkdtemp()
     temp_config_name = Path(dirpath) / "config.ini"
     temp_config = open(temp_config_name, "wt")
@@ -298,3 +302,40 @@ def test__get_settings_load_function(
         resulting_dict=resulting_dict,
         function_in_test=f,
     )
+
+
+def test__settings_config_load_result_is_private_copy(dummy_settings):
+    file_path = [Path("tests/config/example_cfg1.yaml"), Path("tests/config/example_cfg3.json")]
+    first = _settings_config_load(settings=dummy_settings, file_path=file_path)
+    first["runserver"]["nested_list"].append(1)
+    second = _settings_config_load(settings=dummy_settings, file_path=file_path)
+    assert second == {"main": "started", "runserver": {"nested_list": [42, 96], "port": 3333}}
+
+
+def test__settings_config_load_caches_only_small_toml_and_yaml(dummy_settings):
+    from pyconfme.config import config_file_loaders
+
+    file_path = [Path("tests/config/example_cfg1.yaml"), Path("tests/config/example_cfg3.json")]
+    _settings_config_load(settings=dummy_settings, file_path=file_path)
+    cached_files = {key[:2] for key in config_file_loaders._PARSE_CACHE}
+    for cached, path in zip((True, False), file_path):
+        file_stat = path.stat()
+        assert ((file_stat.st_dev, file_stat.st_ino) in cached_files) is cached
+
+
+def test__settings_config_load_stops_at_first_error(dummy_settings):
+    later_source = StringIO('{"main": "started"}')
+    with pytest.raises(DictLoadError):
+        _settings_config_load(
+            settings=dummy_settings,
+            file_path=[Path("tests/config/example_malformed_cfg3.json"), later_source],
+        )
+    # the source after the malformed file has not been read
+    assert later_source.tell() == 0
+
+
+def test__get_settings_load_function_invalid_error_handling():
+    with pytest.raises(ValueError):
+        get_settings_config_load_function(
+            Path("tests/config/example_cfg1.yaml"), error_handling="unknown"
+        )
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from pydantic.dataclasses import dataclass
+
+from pyconfme.config.settings_doc import is_pydantic_dataclass, with_attrs_docs
+
+
+@with_attrs_docs
+class DummyModel(BaseModel):
+    port: int = 1234
+    """port of the server"""
+
+
+@with_attrs_docs
+@dataclass
+class DummyDataclass:
+    #: port of the server
+    port: int = 1234
+
+
+def test_is_pydantic_dataclass():
+    assert is_pydantic_dataclass(DummyDataclass)
+    assert not is_pydantic_dataclass(DummyModel)
+
+
+def test_with_attrs_docs_model():
+    assert DummyModel.__fields__["port"].field_info.description == "port of the server"
+
+
+def test_with_attrs_docs_dataclass():
+    # the docs are applied to the model pydantic generates for the dataclass
+    field = DummyDataclass.__pydantic_model__.__fields__["port"]
+    assert field.field_info.description == "port of the server"
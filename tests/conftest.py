@@ -0,0 +1,14 @@
+import os
+
+from hypothesis import HealthCheck, settings
+
+# few examples per property test during development and in CI; select the "thorough"
+# profile via the HYPOTHESIS_PROFILE environment variable for exhaustive runs (eg. in CI)
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    suppress_health_check=[HealthCheck.too_slow],
+    deadline=None,
+)
+settings.register_profile("thorough", max_examples=200)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+import pyconfme
+
+
+def test_import_does_not_load_click_and_pydantic():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pyconfme; print('click' in sys.modules, 'pydantic' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False False"
+
+
+def test_loading_json_does_not_load_yaml():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from pyconfme.config.config_file_loaders import load_dict_from_file;"
+            " load_dict_from_file('tests/config/example_cfg3.json'); print('yaml' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("name", pyconfme.__all__)
+def test_lazy_exports(name):
+    assert getattr(pyconfme, name) is not None
+    assert name in dir(pyconfme)
+    # resolved exports are also module globals, but are listed only once
+    assert dir(pyconfme).count(name) == 1
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        _ = pyconfme.does_not_exist
@@ -1,236 +1,202 @@
-from hypothesis.strategies._internal.core import recursive
 import pytest
-from hypothesis import given, strategies as st
+from collections import namedtuple
+from hypothesis import given, settings, strategies as st
 from string import printable
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any
 import json
 from pyconfme.utility.dict_deep_update import (
     dict_deep_update,
     MAX_RECURSION_DEPTH,
 )
 
-key_strategies = (
-    st.none() | st.booleans() | st.integers() | st.floats() | st.text(printable)
+# NaN is excluded, as it is unequal to itself and would fail the comparison of results
+non_text_scalar_strategies = (
+    st.none() | st.booleans() | st.integers() | st.floats(allow_nan=False)
 )
+scalar_strategies = non_text_scalar_strategies | st.text(printable)
+# dict_deep_update does not look into keys, so a few distinct strings suffice as text keys
+text_key_strategies = st.sampled_from(("", " ", "a", "b", "key", "x\n", "\u03b1"))
+key_strategies = non_text_scalar_strategies | text_key_strategies
 value_strategies = (
-    st.none()
-    | st.booleans()
-    | st.integers()
-    | st.floats()
-    | st.text(printable)
-    | st.lists(
-        st.none() | st.booleans() | st.integers() | st.floats() | st.text(printable)
-    )
-    | st.dictionaries(
-        st.text(printable),
-        st.none() | st.booleans() | st.integers() | st.floats() | st.text(printable),
-    )
-)
-value_no_lists_strategies = (
-    st.none()
-    | st.booleans()
-    | st.integers()
-    | st.floats()
-    | st.text(printable)
+    scalar_strategies
+    | st.lists(scalar_strategies)
+    | st.dictionaries(st.text(printable), scalar_strategies)
 )
+value_no_lists_strategies = scalar_strategies
 
 
+# keys and values used to build target, source and result of a test case
+DrawnValues = namedtuple(
+    "DrawnValues", ["k1", "v1", "k2", "v2", "k3", "v3", "vp1", "vp2", "vp3", "vnl1", "vnl2"]
+)
+dict_deep_update_strategy = st.builds(
+    DrawnValues,
+    key_strategies,
+    value_strategies,
+    key_strategies,
+    value_strategies,
+    key_strategies,
+    value_strategies,
+    key_strategies,
+    key_strategies,
+    key_strategies,
+    value_no_lists_strategies,
+    value_no_lists_strategies,
+)
 
-@st.composite
-def dict_deep_update_strategy(draw, keys=key_strategies, values=value_strategies, values_no_lists=value_no_lists_strategies):
-
-    k1 = draw(keys)
-    v1 = draw(values)
-    k2 = draw(keys)
-    v2 = draw(values)
-    k3 = draw(keys)
-    v3 = draw(values)
-    vp1 = draw(keys)
-    vp2 = draw(keys)
-    vp3 = draw(keys)
-    vnl1 = draw(values_no_lists)
-    vnl2 = draw(values_no_lists)
-
-    return (k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2)
-
-
-
-def _check_test_case_dict(test_case_dict):
-    merged_dict = test_case_dict["target"]
-    dict_deep_update(merged_dict, test_case_dict["source"])
-    assert merged_dict == test_case_dict["result"]
-
-
-def _inner_test_dict_deep_merge(test_case_dict):
-    if test_case_dict["target"] is None or test_case_dict["source"] is None:
-        with pytest.raises(ValueError):
-            _check_test_case_dict(test_case_dict)
-        return None
-
-    if test_case_dict["should_raise_recursion_exception"] == True:
-        with pytest.raises(RecursionError):
-            _check_test_case_dict(test_case_dict)
-        return None
-
-    _check_test_case_dict(test_case_dict)
-
-
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_001(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: vnl1},
-        "source": {k3: vnl2},
-        "result": {k1: v1, k2: vnl1, k3: vnl2},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-    
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_002(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: vp2},
-        "source": {k2: vp3},
-        "result": {k1: v1, k2: vp3},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_003(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: [vp2]},
-        "source": {k2: [v2, vp3]},
-        "result": {k1: v1, k2: [vp2, v2, vp3]},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_004(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: [vp2]},
-        "source": {k2: vp3},
-        "result": {k1: v1, k2: vp3},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_005(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: {k3: vp2} },
-        "source": {k2: [v2, vp3]},
-        "result": {k1: v1, k2: [v2, vp3]},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_006(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: {k3: vp2}},
-        "source": {k2: vp3},
-        "result": {k1: v1, k2: vp3},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_007(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: {k3: vp2}},
-        "source": {k2: {k3: vp3}},
-        "result": {k1: v1, k2: {k3: vp3}},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_008(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: {k3: vp2}},
-        "source": {k2: {k2: v3}},
-        "result": {k1: v1, k2: {k3: vp2, k2: v3}},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_009(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: {k3: vp2}},
-        "source": {k2: {k2: v3}},
-        "result": {k1: v1, k2: {k3: vp2, k2: v3}},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_010(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: {k3: vp2}},
-        "source": {k2: {k2: v3}},
-        "result": {k1: v1, k2: {k3: vp2, k2: v3}},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
-def test_dict_deep_update_011(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: vnl1},
-        "source": {k2: vnl2},
-        "result": {k1: v1, k2: vnl2},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
+# the merge tests draw the same examples on every run, so that failures are
+# reproducible without hypothesis' example database
+reproducible = settings(derandomize=True, database=None)
+
+
+def _inner_test_dict_deep_merge(target, source, result, expected_exception=None):
+    if target is None or source is None:
+        expected_exception = ValueError
+    if expected_exception is None:
+        dict_deep_update(target, source)
+        assert target == result
+    else:
+        with pytest.raises(expected_exception):
+            dict_deep_update(target, source)
+
+
+# merge test cases as (target, source, result) built from the drawn keys and values
+_MERGE_TEST_CASES = [
+    pytest.param(
+        lambda k1, v1, k2, k3, vnl1, vnl2, **_: (
+            {k1: v1, k2: vnl1},
+            {k3: vnl2},
+            {k1: v1, k2: vnl1, k3: vnl2},
+        ),
+        id="001",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, vp2, vp3, **_: (
+            {k1: v1, k2: vp2},
+            {k2: vp3},
+            {k1: v1, k2: vp3},
+        ),
+        id="002",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, v2, vp2, vp3, **_: (
+            {k1: v1, k2: [vp2]},
+            {k2: [v2, vp3]},
+            {k1: v1, k2: [vp2, v2, vp3]},
+        ),
+        id="003",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, vp2, vp3, **_: (
+            {k1: v1, k2: [vp2]},
+            {k2: vp3},
+            {k1: v1, k2: vp3},
+        ),
+        id="004",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, v2, k3, vp2, vp3, **_: (
+            {k1: v1, k2: {k3: vp2}},
+            {k2: [v2, vp3]},
+            {k1: v1, k2: [v2, vp3]},
+        ),
+        id="005",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, k3, vp2, vp3, **_: (
+            {k1: v1, k2: {k3: vp2}},
+            {k2: vp3},
+            {k1: v1, k2: vp3},
+        ),
+        id="006",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, k3, vp2, vp3, **_: (
+            {k1: v1, k2: {k3: vp2}},
+            {k2: {k3: vp3}},
+            {k1: v1, k2: {k3: vp3}},
+        ),
+        id="007",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, k3, v3, vp2, **_: (
+            {k1: v1, k2: {k3: vp2}},
+            {k2: {k2: v3}},
+            {k1: v1, k2: {k3: vp2, k2: v3}},
+        ),
+        id="008",
+    ),
+    pytest.param(
+        lambda k1, v1, k2, vnl1, vnl2, **_: (
+            {k1: v1, k2: vnl1},
+            {k2: vnl2},
+            {k1: v1, k2: vnl2},
+        ),
+        id="011",
+    ),
+]
+
+
+@pytest.mark.parametrize("test_case", _MERGE_TEST_CASES)
+@reproducible
+@given(dict_keys_values=dict_deep_update_strategy)
+def test_dict_deep_update(test_case, dict_keys_values):
+    target, source, result = test_case(**dict_keys_values._asdict())
+    _inner_test_dict_deep_merge(target, source, result)
+
+
+def _nest(key, value, depth):
+    """Wrap value in `depth` nested dictionaries, each holding `key` only."""
+    for _ in range(depth):
+        value = {key: value}
+    return value
+
+
+@reproducible
+@given(dict_keys_values=dict_deep_update_strategy)
 def test_dict_deep_update_012(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    assert MAX_RECURSION_DEPTH == 8
-    test_case_dict = {
-        "should_raise_recursion_exception": False,
-        "target": {k1: v1, k2: vnl2},
-        "source": {k2: {k1: {k1: {k1: {k1: {k1: {k1: { k1: { k1: {k1: [v1, v2]}}}}}}}}}},
-        "result": {k1: v1, k2: {k1: {k1: {k1: {k1: {k1: {k1: { k1: { k1: {k1: [v1, v2]}}}}}}}}}},
-    }
-    _inner_test_dict_deep_merge(test_case_dict)
-
-
-@given(dict_keys_values=dict_deep_update_strategy())
+    k1, v1, k2, v2, _, _, _, _, _, _, vnl2 = dict_keys_values
+    # a source deeper than MAX_RECURSION_DEPTH is copied, not merged, into a flat target
+    _inner_test_dict_deep_merge(
+        target={k1: v1, k2: vnl2},
+        source={k2: _nest(k1, [v1, v2], MAX_RECURSION_DEPTH + 1)},
+        result={k1: v1, k2: _nest(k1, [v1, v2], MAX_RECURSION_DEPTH + 1)},
+    )
+
+
+@reproducible
+@given(dict_keys_values=dict_deep_update_strategy)
 def test_dict_deep_update_013(dict_keys_values):
-    k1,v1,k2,v2,k3,v3,vp1,vp2,vp3,vnl1,vnl2 = dict_keys_values
-    assert MAX_RECURSION_DEPTH == 8
-    test_case_dict = {
-        "should_raise_recursion_exception": True,
-        "target": {k1: v1, k2: {k1: {k1: {k1: {k1: {k1: {k1: { k1: { k1: {k1: [v1, v3]}}}}}}}}}},
-        "source": {k2: {k1: {k1: {k1: {k1: {k1: {k1: { k1: { k1: {k1: [v1, v2]}}}}}}}}}},
-        "result": {k1: v1, k2: {k1: {k1: {k1: {k1: {k1: {k1: { k1: { k1: {k1: [v1, v2]}}}}}}}}}},
-    }
-    assert test_case_dict["should_raise_recursion_exception"] == True
-    _inner_test_dict_deep_merge(test_case_dict)
+    k1, v1, k2, v2, _, v3, _, _, _, _, _ = dict_keys_values
+    # merging one level deeper than MAX_RECURSION_DEPTH, the least depth which raises
+    _inner_test_dict_deep_merge(
+        target={k1: v1, k2: _nest(k1, [v1, v3], MAX_RECURSION_DEPTH + 1)},
+        source={k2: _nest(k1, [v1, v2], MAX_RECURSION_DEPTH + 1)},
+        result=None,
+        expected_exception=RecursionError,
+    )
 
 
+def test_dict_deep_update_max_depth():
+    target = {"a": _nest("a", [1], MAX_RECURSION_DEPTH)}
+    dict_deep_update(target, {"a": _nest("a", [2], MAX_RECURSION_DEPTH)})
+    assert target == {"a": _nest("a", [1, 2], MAX_RECURSION_DEPTH)}
+
+
+@pytest.mark.parametrize(
+    "source_value",
+    [[1, "a"], {"a": 1}, {1, "a"}, [[1]], {"a": [1]}, {"a": {"b": 1}}],
+)
+def test_dict_deep_update_does_not_share_values(source_value):
+    source = {"key": source_value}
+    expected = json.loads(json.dumps(source, default=list))
+    target: Dict[Any, Any] = {}
+    dict_deep_update(target, source)
+    assert target == source
+    assert target["key"] is not source_value
+    # mutating the merged values in the target must not change the source
+    values = target["key"].values() if isinstance(source_value, dict) else target["key"]
+    for value in list(values):
+        if isinstance(value, (list, dict)):
+            value.clear()
+    assert json.loads(json.dumps(source, default=list)) == expected